@@ -2,907 +2,197 @@
 # Improved UI: added toolbar (zoom/reset/snapshot), keyboard shortcuts, grid toggle,
 # accessibility names/tooltips, better color dialog usage, improved animation timing,
 # and various UX refinements (validation messages, helpful defaults).
-# Add this import near your other PyQt imports at the top of the file:
-from PyQt5.QtWidgets import QColorDialog, QAction
 import sys
 import math
 import json
+import re
+from collections import deque, namedtuple
 from datetime import datetime
-from PyQt5.QtGui import (
-    QPolygonF, QBrush, QPen, QColor, QFont, QPainter, QPixmap, QIcon, QImage
-)
-from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QComboBox, QMessageBox, QGraphicsScene, QGraphicsView,
-    QSizePolicy, QCheckBox, QGroupBox, QTextEdit, QTabWidget, QFrame,
-    QGridLayout, QSpacerItem, QSizePolicy, QFileDialog, QSlider, QDoubleSpinBox,
-    QColorDialog, QToolBar, QAction, QShortcut
+    QSizePolicy, QCheckBox, QGroupBox, QTabWidget, QFileDialog, QSlider, QDoubleSpinBox,
+    QColorDialog, QToolBar, QAction, QShortcut, QGraphicsEllipseItem, QGraphicsRectItem,
+    QGraphicsPolygonItem, QGraphicsSimpleTextItem
 )
-from PyQt5.QtGui import QPolygonF, QBrush, QPen, QColor, QFont, QPixmap, QIcon, QKeySequence
-from PyQt5.QtCore import QPointF, QRectF, Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve
-
-# ----------------- Enums for better code readability -----------------
-class ShapeType(Enum):
-    # 2D Shapes
-    CIRCLE = "Circle"
-    RECTANGLE = "Rectangle"
-    TRIANGLE = "Triangle"
-    SQUARE = "Square"
-    ELLIPSE = "Ellipse"
-    PARALLELOGRAM = "Parallelogram"
-    RHOMBUS = "Rhombus"
-    PENTAGON = "Pentagon"
-    HEXAGON = "Hexagon"
-    OCTAGON = "Octagon"
-    STAR = "Star"
-    # 3D Shapes
-    SPHERE = "Sphere"
-    CUBE = "Cube"
-    CYLINDER = "Cylinder"
-    CONE = "Cone"
-    PYRAMID = "Pyramid"
-
-
-class AlignmentType(Enum):
-    CENTER = "Center"
-    TOP = "Top"
-    BOTTOM = "Bottom"
-    LEFT = "Left"
-    RIGHT = "Right"
-    OVERLAP = "Overlap"
-    ORBIT = "Orbit"
-    RANDOM = "Random"
-
-
-class ThemeType(Enum):
-    LIGHT = "Light"
-    DARK = "Dark"
-    BLUE = "Blue"
-    GREEN = "Green"
-    COSMIC = "Cosmic"
-
-
-# ----------------- Base / Abstract classes -----------------
-class Shape(ABC):
-    """Abstract base class for all shapes."""
-
-    @abstractmethod
-    def area(self):
-        pass
-
-    @abstractmethod
-    def perimeter(self):
-        pass
-
-    @abstractmethod
-    def volume(self):
-        """For 3D shapes, returns volume. For 2D shapes, returns 0."""
-        pass
-
-    @abstractmethod
-    def natural_size(self):
-        """Return (width, height, depth) in the shape's own units (unscaled)."""
-        pass
-
-    @abstractmethod
-    def draw(self, scene: QGraphicsScene, cx: float, cy: float, scale: float, color: QColor = None):
-        """Draw shape centered at (cx, cy) with a scale factor (units -> pixels)."""
-        pass
-
-    def bounding_box(self, cx: float, cy: float, scale: float):
-        """Return (x_min, y_min, x_max, y_max) in pixels for overlap detection."""
-        w, h, _ = self.natural_size()
-        w_px = w * scale
-        h_px = h * scale
-        return (cx - w_px/2, cy - h_px/2, cx + w_px/2, cy + h_px/2)
-
-    def __str__(self):
-        """String representation of the shape with its properties."""
-        try:
-            return f"{self.__class__.__name__}: Area={self.area():.2f}, Perimeter={self.perimeter():.2f}"
-        except Exception:
-            return f"{self.__class__.__name__}"
-
-
-class Shape2D(Shape, ABC):
-    """Abstract base class for 2D shapes."""
-
-    def volume(self):
-        return 0  # 2D shapes have no volume
-
-
-class Shape3D(Shape, ABC):
-    """Abstract base class for 3D shapes."""
-
-    def perimeter(self):
-        return 0  # 3D shapes typically don't have perimeter in the same sense
-
-
-# ----------------- 2D Shapes -----------------
-class Circle(Shape2D):
-    def __init__(self, radius):
-        if radius <= 0:
-            raise ValueError("Radius must be positive")
-        self._radius = radius
-
-    def area(self):
-        return math.pi * self._radius ** 2
-
-    def perimeter(self):
-        return 2 * math.pi * self._radius
-
-    def natural_size(self):
-        d = 2 * self._radius
-        return (d, d, 0)  # 2D shape has depth=0
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        diameter_px = 2 * self._radius * scale
-        x = cx - diameter_px/2
-        y = cy - diameter_px/2
-
-        fill_color = color if color else QColor("#4FC3F7")
-        border_color = fill_color.darker(150)
-
-        ellipse = scene.addEllipse(x, y, diameter_px, diameter_px)
-        ellipse.setBrush(QBrush(fill_color))
-        ellipse.setPen(QPen(border_color, 2))
-        ellipse.setZValue(1)
-
-
-class Rectangle(Shape2D):
-    def __init__(self, width, height):
-        if width <= 0 or height <= 0:
-            raise ValueError("Width and height must be positive")
-        self._width = width
-        self._height = height
-
-    def area(self):
-        return self._width * self._height
-
-    def perimeter(self):
-        return 2 * (self._width + self._height)
-
-    def natural_size(self):
-        return (self._width, self._height, 0)
+from PyQt5.QtGui import (
+    QPen, QColor, QPainter, QIcon, QImage, QKeySequence, QPainterPath,
+    QRegularExpressionValidator
+)
+from PyQt5.QtCore import QRectF, Qt, QSize, QTimer, QRegularExpression
 
-    def draw(self, scene, cx, cy, scale, color=None):
-        w_px = self._width * scale
-        h_px = self._height * scale
-        x = cx - w_px/2
-        y = cy - h_px/2
+from shapes import (
+    ShapeType, AlignmentType, AstronomicalObject, ShapeFactory, orbit_point, rects_overlap
+)
 
-        fill_color = color if color else QColor("#81C784")
-        border_color = fill_color.darker(150)
 
-        rect = scene.addRect(x, y, w_px, h_px)
-        rect.setBrush(QBrush(fill_color))
-        rect.setPen(QPen(border_color, 2))
-        rect.setZValue(1)
+# ----------------- Layout helpers -----------------
+# Where calculate() put everything: positions are (x, y) scene points and the
+# bounding boxes are (x0, y0, x1, y1); the astro fields are None without an astro object
+_Layout = namedtuple('_Layout', 'scale alignment astro_pos shape_pos astro_bb shape_bb')
 
 
-class Triangle(Shape2D):
-    def __init__(self, base, height):
-        if base <= 0 or height <= 0:
-            raise ValueError("Base and height must be positive")
-        self._base = base
-        self._height = height
+def _fit_scale(scene_w, scene_h, w, h, fraction):
+    """Return the largest scale at which a w x h box fits in `fraction` of the scene."""
+    scale_x = (scene_w * fraction) / w if w > 0 else 1
+    scale_y = (scene_h * fraction) / h if h > 0 else 1
+    return min(scale_x, scale_y)
 
-    def area(self):
-        return 0.5 * self._base * self._height
 
-    def perimeter(self):
-        hyp = math.sqrt(self._base**2 + self._height**2)
-        return self._base + self._height + hyp
+# ----------------- Scene helpers -----------------
+class _ItemRecycler:
+    """Stand-in for a QGraphicsScene that hands back existing items instead of new ones.
 
-    def natural_size(self):
-        return (self._base, self._height, 0)
+    Items left over from the previous shape are pooled by kind, so any shape that
+    adds ellipses, rects or polygons repositions and restyles the old items of that
+    kind and only asks the real scene for a new item once the pool runs dry.
+    """
 
-    def draw(self, scene, cx, cy, scale, color=None):
-        base_px = self._base * scale
-        height_px = self._height * scale
+    def __init__(self, scene, items):
+        self._scene = scene
+        self._pools = {QGraphicsEllipseItem: [], QGraphicsRectItem: [], QGraphicsPolygonItem: []}
+        for item in reversed(items):
+            self._pools[type(item)].append(item)
 
-        fill_color = color if color else QColor("#FFF176")
-        border_color = fill_color.darker(150)
+    def _next(self, kind, pen, brush):
+        pool = self._pools[kind]
+        if not pool:
+            return None
+        item = pool.pop()
+        item.setPos(0, 0)  # undo any animation offset
+        item.setPen(pen)
+        item.setBrush(brush)
+        self._scene.addItem(item)
+        return item
+
+    def addEllipse(self, x, y, w, h, pen, brush):
+        item = self._next(QGraphicsEllipseItem, pen, brush)
+        if item is None:
+            return self._scene.addEllipse(x, y, w, h, pen, brush)
+        item.setRect(x, y, w, h)
+        return item
+
+    def addRect(self, x, y, w, h, pen, brush):
+        item = self._next(QGraphicsRectItem, pen, brush)
+        if item is None:
+            return self._scene.addRect(x, y, w, h, pen, brush)
+        item.setRect(x, y, w, h)
+        return item
+
+    def addPolygon(self, polygon, pen, brush):
+        item = self._next(QGraphicsPolygonItem, pen, brush)
+        if item is None:
+            return self._scene.addPolygon(polygon, pen, brush)
+        item.setPolygon(polygon)
+        return item
+
+
+@lru_cache(maxsize=8)
+def _grid_pen(name):
+    """Return the grid pen for a theme color string, parsed once per theme."""
+    color = QColor(name)
+    color.setAlpha(100)  # Semi-transparent
+    return QPen(color, 0.5)
+
+
+# Fixed pens for the canvas decorations, shared by every redraw
+_AXIS_PEN = QPen(QColor(150, 150, 150, 160), 1)
+_ASTRO_MARKER_PEN = QPen(Qt.green, 2)
+_SHAPE_MARKER_PEN = QPen(Qt.red, 2)
+_LINK_PEN = QPen(Qt.blue, 1, Qt.DashLine)
+_ORBIT_PEN = QPen(QColor(255, 255, 255, 100), 1, Qt.DashLine)
+
+
+@lru_cache(maxsize=4)
+def _grid_paths(width, height):
+    """Return the (grid, axes) line paths for a scene size, built once per size.
+
+    All lines go into one path each so the scene holds a single item per layer,
+    and redraws at an unchanged size reuse the finished paths.
+    """
+    grid_path = QPainterPath()
+    step = 50
+    for y in range(0, height, step):
+        grid_path.moveTo(0, y)
+        grid_path.lineTo(width, y)
+    for x in range(0, width, step):
+        grid_path.moveTo(x, 0)
+        grid_path.lineTo(x, height)
+
+    center_x = width / 2
+    center_y = height / 2
+    axis_path = QPainterPath()
+    axis_path.moveTo(0, center_y)
+    axis_path.lineTo(width, center_y)
+    axis_path.moveTo(center_x, 0)
+    axis_path.lineTo(center_x, height)
+    return grid_path, axis_path
+
+
+# ----------------- Export helpers -----------------
+# Markup used by the results label; <br> becomes a newline, the rest is dropped
+_HTML_TAG_RE = re.compile(r'<br>|</?b>|</?h3>')
+
+
+def _html_to_text(html):
+    """Strip the results label's markup in one pass."""
+    return _HTML_TAG_RE.sub(lambda m: '\n' if m.group() == '<br>' else '', html)
+
+
+# ----------------- Widget helpers -----------------
+def _set_text(label, text):
+    """Set a label's text, skipping the relayout when the text is unchanged."""
+    if label.text() != text:
+        label.setText(text)
+
+
+# ----------------- Input helpers -----------------
+# What the line edits let through while typing: unsigned decimals with an
+# optional exponent, comma-separated in the parameter fields
+_NUMBER_PATTERN = r'\s*\d*\.?\d*(?:[eE][+-]?\d*)?\s*'
+_NUMBER_LIST_PATTERN = rf'{_NUMBER_PATTERN}(?:,{_NUMBER_PATTERN})*'
+
+
+def _parse_number(text):
+    """Convert stripped, non-empty text to float; raises ValueError naming the bad text."""
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"Invalid number: {text}") from None
+
+
+def _parse_entry(entry):
+    """Return the float in a line edit, or None if it is blank.
+
+    Raises ValueError for text that is not a number.
+    """
+    text = entry.text().strip()
+    if not text:
+        return None
+    return _parse_number(text)
 
-        # center the triangle vertically at cy (apex up)
-        points = [
-            QPointF(cx, cy - height_px/2),
-            QPointF(cx - base_px/2, cy + height_px/2),
-            QPointF(cx + base_px/2, cy + height_px/2)
-        ]
-        polygon = QPolygonF(points)
-        item = scene.addPolygon(polygon)
-        item.setBrush(QBrush(fill_color))
-        item.setPen(QPen(border_color, 2))
-        item.setZValue(1)
-
-
-class Square(Shape2D):
-    def __init__(self, side):
-        if side <= 0:
-            raise ValueError("Side must be positive")
-        self._side = side
-
-    def area(self):
-        return self._side ** 2
-
-    def perimeter(self):
-        return 4 * self._side
-
-    def natural_size(self):
-        return (self._side, self._side, 0)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        s_px = self._side * scale
-        x = cx - s_px/2
-        y = cy - s_px/2
-
-        fill_color = color if color else QColor("#FF8A65")
-        border_color = fill_color.darker(150)
-
-        rect = scene.addRect(x, y, s_px, s_px)
-        rect.setBrush(QBrush(fill_color))
-        rect.setPen(QPen(border_color, 2))
-        rect.setZValue(1)
-
-
-class Ellipse(Shape2D):
-    def __init__(self, a, b):
-        if a <= 0 or b <= 0:
-            raise ValueError("Axes must be positive")
-        self._a = a  # semi-major
-        self._b = b  # semi-minor
-
-    def area(self):
-        return math.pi * self._a * self._b
-
-    def perimeter(self):
-        h = ((self._a - self._b) ** 2) / ((self._a + self._b) ** 2)
-        return math.pi * (self._a + self._b) * (1 + (3*h) / (10 + math.sqrt(4 - 3*h)))
-
-    def natural_size(self):
-        return (2 * self._a, 2 * self._b, 0)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        w_px = 2 * self._a * scale
-        h_px = 2 * self._b * scale
-        x = cx - w_px/2
-        y = cy - h_px/2
-
-        fill_color = color if color else QColor("#DCE775")
-        border_color = fill_color.darker(150)
-
-        ellipse = scene.addEllipse(x, y, w_px, h_px)
-        ellipse.setBrush(QBrush(fill_color))
-        ellipse.setPen(QPen(border_color, 2))
-        ellipse.setZValue(1)
-
-
-class Parallelogram(Shape2D):
-    def __init__(self, base, side, height):
-        if base <= 0 or side <= 0 or height <= 0:
-            raise ValueError("Dimensions must be positive")
-        self._base = base
-        self._side = side
-        self._height = height
-
-    def area(self):
-        return self._base * self._height
-
-    def perimeter(self):
-        return 2 * (self._base + self._side)
-
-    def natural_size(self):
-        # give some horizontal extra for shear
-        return (self._base + self._base * 0.2, self._height, 0)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        base_px = self._base * scale
-        height_px = self._height * scale
-        shear = base_px * 0.2
-        x0 = cx - base_px/2
-        y0 = cy - height_px/2
-
-        fill_color = color if color else QColor("#4DD0E1")
-        border_color = fill_color.darker(150)
-
-        points = [
-            QPointF(x0, y0),
-            QPointF(x0 + base_px, y0),
-            QPointF(x0 + base_px + shear, y0 + height_px),
-            QPointF(x0 + shear, y0 + height_px)
-        ]
-        polygon = QPolygonF(points)
-        item = scene.addPolygon(polygon)
-        item.setBrush(QBrush(fill_color))
-        item.setPen(QPen(border_color, 2))
-        item.setZValue(1)
-
-
-class Rhombus(Shape2D):
-    def __init__(self, d1, d2):
-        if d1 <= 0 or d2 <= 0:
-            raise ValueError("Diagonals must be positive")
-        self._d1 = d1
-        self._d2 = d2
-
-    def area(self):
-        return (self._d1 * self._d2) / 2
-
-    def perimeter(self):
-        side = math.sqrt((self._d1/2)**2 + (self._d2/2)**2)
-        return 4 * side
-
-    def natural_size(self):
-        return (self._d1, self._d2, 0)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        d1_px = self._d1 * scale
-        d2_px = self._d2 * scale
-
-        fill_color = color if color else QColor("#BA68C8")
-        border_color = fill_color.darker(150)
-
-        points = [
-            QPointF(cx, cy - d2_px / 2),
-            QPointF(cx + d1_px / 2, cy),
-            QPointF(cx, cy + d2_px / 2),
-            QPointF(cx - d1_px / 2, cy)
-        ]
-        polygon = QPolygonF(points)
-        item = scene.addPolygon(polygon)
-        item.setBrush(QBrush(fill_color))
-        item.setPen(QPen(border_color, 2))
-        item.setZValue(1)
-
-
-class Pentagon(Shape2D):
-    def __init__(self, side):
-        if side <= 0:
-            raise ValueError("Side must be positive")
-        self._side = side
-
-    def area(self):
-        return (5 * self._side**2) / (4 * math.tan(math.pi/5))
-
-    def perimeter(self):
-        return 5 * self._side
-
-    def natural_size(self):
-        # approximate bounding box using circumradius ≈ 1.539 * side
-        r = 1.539 * self._side
-        return (2*r, 2*r, 0)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        r_px = 1.539 * self._side * scale
-
-        fill_color = color if color else QColor("#FFB74D")
-        border_color = fill_color.darker(150)
-
-        points = []
-        for i in range(5):
-            angle = 2 * math.pi * i / 5 - math.pi/2
-            x = cx + r_px * math.cos(angle)
-            y = cy + r_px * math.sin(angle)
-            points.append(QPointF(x, y))
-        polygon = QPolygonF(points)
-        item = scene.addPolygon(polygon)
-        item.setBrush(QBrush(fill_color))
-        item.setPen(QPen(border_color, 2))
-        item.setZValue(1)
-
-
-class Hexagon(Shape2D):
-    def __init__(self, side):
-        if side <= 0:
-            raise ValueError("Side must be positive")
-        self._side = side
-
-    def area(self):
-        return (3 * math.sqrt(3) * self._side**2) / 2
-
-    def perimeter(self):
-        return 6 * self._side
-
-    def natural_size(self):
-        # Bounding box: width = 2 * side, height = √3 * side
-        width = 2 * self._side
-        height = math.sqrt(3) * self._side
-        return (width, height, 0)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        side_px = self._side * scale
-
-        fill_color = color if color else QColor("#4DB6AC")
-        border_color = fill_color.darker(150)
-
-        points = []
-        for i in range(6):
-            angle = 2 * math.pi * i / 6
-            x = cx + side_px * math.cos(angle)
-            y = cy + side_px * math.sin(angle)
-            points.append(QPointF(x, y))
-        polygon = QPolygonF(points)
-        item = scene.addPolygon(polygon)
-        item.setBrush(QBrush(fill_color))
-        item.setPen(QPen(border_color, 2))
-        item.setZValue(1)
-
-
-class Octagon(Shape2D):
-    def __init__(self, side):
-        if side <= 0:
-            raise ValueError("Side must be positive")
-        self._side = side
-
-    def area(self):
-        return 2 * (1 + math.sqrt(2)) * self._side**2
-
-    def perimeter(self):
-        return 8 * self._side
-
-    def natural_size(self):
-        # Bounding box: width = height = (1 + √2) * side
-        size = (1 + math.sqrt(2)) * self._side
-        return (size, size, 0)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        r_px = self._side / math.cos(math.pi/8) * scale
-
-        fill_color = color if color else QColor("#7986CB")
-        border_color = fill_color.darker(150)
-
-        points = []
-        for i in range(8):
-            angle = 2 * math.pi * i / 8 - math.pi/8
-            x = cx + r_px * math.cos(angle)
-            y = cy + r_px * math.sin(angle)
-            points.append(QPointF(x, y))
-        polygon = QPolygonF(points)
-        item = scene.addPolygon(polygon)
-        item.setBrush(QBrush(fill_color))
-        item.setPen(QPen(border_color, 2))
-        item.setZValue(1)
-
-
-class Star(Shape2D):
-    def __init__(self, outer_radius, inner_radius):
-        if outer_radius <= 0 or inner_radius <= 0:
-            raise ValueError("Radii must be positive")
-        self._outer_radius = outer_radius
-        self._inner_radius = inner_radius
-
-    def area(self):
-        # Approximation for a 5-pointed star
-        return (5 * self._outer_radius * self._inner_radius *
-                math.sin(math.pi/5) * math.sin(3*math.pi/10) /
-                math.sin(7*math.pi/10))
-
-    def perimeter(self):
-        # Approximation: 10 * average of radii
-        return 10 * (self._outer_radius + self._inner_radius) / 2
-
-    def natural_size(self):
-        return (2 * self._outer_radius, 2 * self._outer_radius, 0)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        outer_r_px = self._outer_radius * scale
-        inner_r_px = self._inner_radius * scale
-
-        fill_color = color if color else QColor("#FFD54F")
-        border_color = fill_color.darker(150)
-
-        points = []
-        for i in range(10):
-            angle = math.pi/2 + 2 * math.pi * i / 10
-            r = outer_r_px if i % 2 == 0 else inner_r_px
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            points.append(QPointF(x, y))
-        polygon = QPolygonF(points)
-        item = scene.addPolygon(polygon)
-        item.setBrush(QBrush(fill_color))
-        item.setPen(QPen(border_color, 2))
-        item.setZValue(1)
-
-
-# ----------------- 3D Shapes -----------------
-class Sphere(Shape3D):
-    def __init__(self, radius):
-        if radius <= 0:
-            raise ValueError("Radius must be positive")
-        self._radius = radius
-
-    def area(self):
-        return 4 * math.pi * self._radius ** 2
-
-    def volume(self):
-        return (4/3) * math.pi * self._radius ** 3
-
-    def natural_size(self):
-        d = 2 * self._radius
-        return (d, d, d)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        # Represent 3D sphere as a circle with shading
-        diameter_px = 2 * self._radius * scale
-
-        fill_color = color if color else QColor("#64B5F6")
-        border_color = fill_color.darker(150)
-        highlight_color = fill_color.lighter(150)
-
-        # Draw main circle
-        x = cx - diameter_px/2
-        y = cy - diameter_px/2
-        ellipse = scene.addEllipse(x, y, diameter_px, diameter_px)
-        ellipse.setBrush(QBrush(fill_color))
-        ellipse.setPen(QPen(border_color, 2))
-        ellipse.setZValue(1)
-
-        # Draw highlight to give 3D effect
-        highlight_diameter = diameter_px * 0.6
-        highlight_x = x + diameter_px * 0.2
-        highlight_y = y + diameter_px * 0.2
-        highlight = scene.addEllipse(highlight_x, highlight_y,
-                                     highlight_diameter, highlight_diameter)
-        highlight.setBrush(QBrush(highlight_color))
-        highlight.setPen(QPen(Qt.NoPen))
-        highlight.setZValue(2)
-
-
-class Cube(Shape3D):
-    def __init__(self, side):
-        if side <= 0:
-            raise ValueError("Side must be positive")
-        self._side = side
-
-    def area(self):
-        return 6 * self._side ** 2
-
-    def volume(self):
-        return self._side ** 3
-
-    def natural_size(self):
-        return (self._side, self._side, self._side)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        side_px = self._side * scale
-
-        fill_color = color if color else QColor("#E57373")
-        border_color = fill_color.darker(150)
-        side_color = fill_color.darker(120)
-        top_color = fill_color.lighter(120)
-
-        x = cx - side_px/2
-        y = cy - side_px/2
-
-        # Draw front face
-        front = scene.addRect(x, y, side_px, side_px)
-        front.setBrush(QBrush(fill_color))
-        front.setPen(QPen(border_color, 2))
-        front.setZValue(1)
-
-        # Draw top face (perspective)
-        top_points = [
-            QPointF(x, y),
-            QPointF(x + side_px, y),
-            QPointF(x + side_px * 0.8, y - side_px * 0.2),
-            QPointF(x - side_px * 0.2, y - side_px * 0.2)
-        ]
-        top = scene.addPolygon(QPolygonF(top_points))
-        top.setBrush(QBrush(top_color))
-        top.setPen(QPen(border_color, 2))
-        top.setZValue(0)
-
-        # Draw side face (perspective)
-        side_points = [
-            QPointF(x + side_px, y),
-            QPointF(x + side_px, y + side_px),
-            QPointF(x + side_px * 0.8, y + side_px * 0.8),
-            QPointF(x + side_px * 0.8, y - side_px * 0.2)
-        ]
-        side = scene.addPolygon(QPolygonF(side_points))
-        side.setBrush(QBrush(side_color))
-        side.setPen(QPen(border_color, 2))
-        side.setZValue(0)
-
-
-class Cylinder(Shape3D):
-    def __init__(self, radius, height):
-        if radius <= 0 or height <= 0:
-            raise ValueError("Radius and height must be positive")
-        self._radius = radius
-        self._height = height
-
-    def area(self):
-        return 2 * math.pi * self._radius * (self._radius + self._height)
-
-    def volume(self):
-        return math.pi * self._radius ** 2 * self._height
-
-    def natural_size(self):
-        return (2 * self._radius, self._height, 2 * self._radius)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        radius_px = self._radius * scale
-        height_px = self._height * scale
-
-        fill_color = color if color else QColor("#AED581")
-        border_color = fill_color.darker(150)
-        top_color = fill_color.lighter(120)
-
-        # Draw main body (rectangle)
-        x = cx - radius_px
-        y = cy - height_px/2
-        body = scene.addRect(x, y, 2 * radius_px, height_px)
-        body.setBrush(QBrush(fill_color))
-        body.setPen(QPen(border_color, 2))
-        body.setZValue(1)
-
-        # Draw top ellipse
-        top_ellipse = scene.addEllipse(x, y - radius_px/2, 2 * radius_px, radius_px)
-        top_ellipse.setBrush(QBrush(top_color))
-        top_ellipse.setPen(QPen(border_color, 2))
-        top_ellipse.setZValue(2)
-
-        # Draw bottom ellipse
-        bottom_ellipse = scene.addEllipse(x, y + height_px - radius_px/2, 2 * radius_px, radius_px)
-        bottom_ellipse.setBrush(QBrush(fill_color.darker(120)))
-        bottom_ellipse.setPen(QPen(border_color, 2))
-        bottom_ellipse.setZValue(0)
-
-
-class Cone(Shape3D):
-    def __init__(self, radius, height):
-        if radius <= 0 or height <= 0:
-            raise ValueError("Radius and height must be positive")
-        self._radius = radius
-        self._height = height
-
-    def area(self):
-        slant_height = math.sqrt(self._radius**2 + self._height**2)
-        return math.pi * self._radius * (self._radius + slant_height)
-
-    def volume(self):
-        return (math.pi * self._radius ** 2 * self._height) / 3
-
-    def natural_size(self):
-        return (2 * self._radius, self._height, 2 * self._radius)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        radius_px = self._radius * scale
-        height_px = self._height * scale
-
-        fill_color = color if color else QColor("#FFB74D")
-        border_color = fill_color.darker(150)
-
-        # Draw base ellipse
-        x = cx - radius_px
-        y = cy + height_px/2 - radius_px/2
-        base = scene.addEllipse(x, y, 2 * radius_px, radius_px)
-        base.setBrush(QBrush(fill_color.darker(120)))
-        base.setPen(QPen(border_color, 2))
-        base.setZValue(0)
-
-        # Draw cone body (triangle)
-        points = [
-            QPointF(cx, cy - height_px/2),  # Apex
-            QPointF(cx - radius_px, cy + height_px/2),  # Base left
-            QPointF(cx + radius_px, cy + height_px/2)   # Base right
-        ]
-        cone = scene.addPolygon(QPolygonF(points))
-        cone.setBrush(QBrush(fill_color))
-        cone.setPen(QPen(border_color, 2))
-        cone.setZValue(1)
-
-
-class Pyramid(Shape3D):
-    def __init__(self, base, height):
-        if base <= 0 or height <= 0:
-            raise ValueError("Base and height must be positive")
-        self._base = base
-        self._height = height
-
-    def area(self):
-        slant_height = math.sqrt((self._base/2)**2 + self._height**2)
-        return self._base**2 + 2 * self._base * slant_height
-
-    def volume(self):
-        return (self._base ** 2 * self._height) / 3
-
-    def natural_size(self):
-        return (self._base, self._height, self._base)
-
-    def draw(self, scene, cx, cy, scale, color=None):
-        base_px = self._base * scale
-        height_px = self._height * scale
-
-        fill_color = color if color else QColor("#9575CD")
-        border_color = fill_color.darker(150)
-        side_color = fill_color.darker(120)
-
-        # Draw base (square)
-        x = cx - base_px/2
-        y = cy + height_px/2 - base_px/2
-        base = scene.addRect(x, y, base_px, base_px)
-        base.setBrush(QBrush(fill_color.darker(120)))
-        base.setPen(QPen(border_color, 2))
-        base.setZValue(0)
-
-        # Draw front face (triangle)
-        front_points = [
-            QPointF(cx, cy - height_px/2),  # Apex
-            QPointF(cx - base_px/2, cy + height_px/2),  # Base left
-            QPointF(cx + base_px/2, cy + height_px/2)   # Base right
-        ]
-        front = scene.addPolygon(QPolygonF(front_points))
-        front.setBrush(QBrush(fill_color))
-        front.setPen(QPen(border_color, 2))
-        front.setZValue(1)
-
-        # Draw side face (triangle with perspective)
-        side_points = [
-            QPointF(cx, cy - height_px/2),  # Apex
-            QPointF(cx + base_px/2, cy + height_px/2),  # Base front right
-            QPointF(cx + base_px/2, cy + height_px/2 - base_px/2)  # Base back right
-        ]
-        side = scene.addPolygon(QPolygonF(side_points))
-        side.setBrush(QBrush(side_color))
-        side.setPen(QPen(border_color, 2))
-        side.setZValue(0.5)
-
-
-# ----------------- Astronomical Object -----------------
-class AstronomicalObject:
-    """Represents astronomical objects for alignment demonstration."""
-
-    def __init__(self, radius, color="#888888", name="Planet", has_rings=False):
-        if radius <= 0:
-            raise ValueError("Astronomical radius must be positive")
-        self._radius = radius
-        self._color = color
-        self._name = name
-        self._has_rings = has_rings
-
-    def natural_size(self):
-        return (2 * self._radius, 2 * self._radius, 2 * self._radius)
-
-    def draw(self, scene, cx, cy, scale):
-        diameter_px = 2 * self._radius * scale
-        x = cx - diameter_px/2
-        y = cy - diameter_px/2
-
-        # Draw the astronomical object
-        item = scene.addEllipse(x, y, diameter_px, diameter_px)
-        item.setBrush(QBrush(QColor(self._color)))
-        item.setPen(QPen(QColor("black"), 2))
-        item.setZValue(0)  # behind shapes
-
-        # Draw rings if applicable
-        if self._has_rings:
-            ring_width = diameter_px * 0.2
-            ring_height = diameter_px * 0.05
-            ring_x = cx - (diameter_px + ring_width)/2
-            ring_y = cy - ring_height/2
-            ring = scene.addEllipse(ring_x, ring_y, diameter_px + ring_width, ring_height)
-            ring.setBrush(QBrush(QColor(210, 180, 140, 180)))  # Tan color with transparency
-            ring.setPen(QPen(QColor(139, 69, 19), 1))  # Brown border
-            ring.setZValue(0.5)
-            ring.setRotation(30)  # Tilt the rings
-
-        # Add a label (white for dark backgrounds; keep readable)
-        text = scene.addText(self._name)
-        # Choose label color based on object brightness
-        try:
-            col = QColor(self._color)
-            brightness = (col.red() * 0.299 + col.green() * 0.587 + col.blue() * 0.114) / 255
-            text_color = QColor("black") if brightness > 0.6 else QColor("white")
-        except Exception:
-            text_color = QColor("white")
-        text.setDefaultTextColor(text_color)
-        text.setPos(cx - text.boundingRect().width()/2,
-                    cy - text.boundingRect().height()/2)
-        text.setZValue(1)
-
-    def bounding_box(self, cx, cy, scale):
-        d = 2 * self._radius * scale
-        return (cx - d/2, cy - d/2, cx + d/2, cy + d/2)
-
-    def calculate_alignment_position(self, shape, alignment, scene_rect, scale):
-        """Calculate position for shape based on alignment with this astronomical object."""
-        scene_w = scene_rect.width()
-        scene_h = scene_rect.height()
 
-        # Center of astronomical object
-        astro_cx = scene_w / 2
-        astro_cy = scene_h / 2
-
-        # Shape dimensions in pixels
-        shape_w, shape_h, _ = shape.natural_size()
-        shape_w_px = shape_w * scale
-        shape_h_px = shape_h * scale
-
-        # Astronomical object radius in pixels
-        astro_radius_px = self._radius * scale
-
-        margin = 10  # Pixel margin
-
-        if alignment == AlignmentType.CENTER:
-            return (astro_cx, astro_cy)
-        elif alignment == AlignmentType.TOP:
-            return (astro_cx, astro_cy - astro_radius_px - shape_h_px/2 - margin)
-        elif alignment == AlignmentType.BOTTOM:
-            return (astro_cx, astro_cy + astro_radius_px + shape_h_px/2 + margin)
-        elif alignment == AlignmentType.LEFT:
-            return (astro_cx - astro_radius_px - shape_w_px/2 - margin, astro_cy)
-        elif alignment == AlignmentType.RIGHT:
-            return (astro_cx + astro_radius_px + shape_w_px/2 + margin, astro_cy)
-        elif alignment == AlignmentType.OVERLAP:
-            return (astro_cx + 0.15 * astro_radius_px, astro_cy + 0.10 * astro_radius_px)
-        elif alignment == AlignmentType.ORBIT:
-            # Position in a circular orbit around the astronomical object
-            angle = 45  # 45 degree angle for demonstration
-            orbit_radius = astro_radius_px + shape_w_px/2 + margin
-            x = astro_cx + orbit_radius * math.cos(math.radians(angle))
-            y = astro_cy + orbit_radius * math.sin(math.radians(angle))
-            return (x, y)
-        elif alignment == AlignmentType.RANDOM:
-            # Random position within the scene
-            min_x = shape_w_px/2 + margin
-            max_x = scene_w - shape_w_px/2 - margin
-            min_y = shape_h_px/2 + margin
-            max_y = scene_h - shape_h_px/2 - margin
-
-            import random
-            x = random.uniform(min_x, max_x)
-            y = random.uniform(min_y, max_y)
-            return (x, y)
-        else:
-            return (astro_cx, astro_cy)
+def _parse_values(entry):
+    """Return the floats in a line edit, which may hold several comma-separated values.
 
+    Blank fields and blank items give no values; raises ValueError for non-numbers.
+    """
+    text = entry.text()
+    if "," not in text:
+        value = _parse_entry(entry)
+        return [] if value is None else [value]
+    return [_parse_number(part) for part in map(str.strip, text.split(",")) if part]
 
-# ----------------- Shape Factory -----------------
-class ShapeFactory:
-    """Factory class to create shape instances based on type and parameters."""
 
-    @staticmethod
-    def create_shape(shape_type, params):
-        if shape_type == ShapeType.CIRCLE:
-            return Circle(params[0])
-        elif shape_type == ShapeType.RECTANGLE:
-            return Rectangle(params[0], params[1])
-        elif shape_type == ShapeType.TRIANGLE:
-            return Triangle(params[0], params[1])
-        elif shape_type == ShapeType.SQUARE:
-            return Square(params[0])
-        elif shape_type == ShapeType.ELLIPSE:
-            return Ellipse(params[0], params[1])
-        elif shape_type == ShapeType.PARALLELOGRAM:
-            return Parallelogram(params[0], params[1], params[2])
-        elif shape_type == ShapeType.RHOMBUS:
-            return Rhombus(params[0], params[1])
-        elif shape_type == ShapeType.PENTAGON:
-            return Pentagon(params[0])
-        elif shape_type == ShapeType.HEXAGON:
-            return Hexagon(params[0])
-        elif shape_type == ShapeType.OCTAGON:
-            return Octagon(params[0])
-        elif shape_type == ShapeType.STAR:
-            return Star(params[0], params[1])
-        elif shape_type == ShapeType.SPHERE:
-            return Sphere(params[0])
-        elif shape_type == ShapeType.CUBE:
-            return Cube(params[0])
-        elif shape_type == ShapeType.CYLINDER:
-            return Cylinder(params[0], params[1])
-        elif shape_type == ShapeType.CONE:
-            return Cone(params[0], params[1])
-        elif shape_type == ShapeType.PYRAMID:
-            return Pyramid(params[0], params[1])
-        else:
-            raise ValueError(f"Unknown shape type: {shape_type}")
+# ----------------- Enums for better code readability -----------------
+class ThemeType(Enum):
+    LIGHT = "Light"
+    DARK = "Dark"
+    BLUE = "Blue"
+    GREEN = "Green"
+    COSMIC = "Cosmic"
 
 
 # ----------------- Theme Manager -----------------
@@ -1003,6 +293,58 @@ class ThemeManager:
 
 # ----------------- GUI Application -----------------
 class GeometryApp(QWidget):
+    # Menu order of the shapes on the 2D and 3D tabs
+    SHAPES_2D = (
+        ShapeType.CIRCLE, ShapeType.RECTANGLE, ShapeType.TRIANGLE, ShapeType.SQUARE,
+        ShapeType.ELLIPSE, ShapeType.PARALLELOGRAM, ShapeType.RHOMBUS, ShapeType.PENTAGON,
+        ShapeType.HEXAGON, ShapeType.OCTAGON, ShapeType.STAR
+    )
+    SHAPES_3D = (
+        ShapeType.SPHERE, ShapeType.CUBE, ShapeType.CYLINDER, ShapeType.CONE, ShapeType.PYRAMID
+    )
+
+    # Input field labels for each shape, in constructor argument order
+    SHAPE_FIELDS = {
+        ShapeType.CIRCLE: ("Radius",),
+        ShapeType.RECTANGLE: ("Width", "Height"),
+        ShapeType.TRIANGLE: ("Base", "Height"),
+        ShapeType.SQUARE: ("Side",),
+        ShapeType.ELLIPSE: ("Major axis", "Minor axis"),
+        ShapeType.PARALLELOGRAM: ("Base", "Side", "Height"),
+        ShapeType.RHOMBUS: ("Diagonal 1", "Diagonal 2"),
+        ShapeType.PENTAGON: ("Side",),
+        ShapeType.HEXAGON: ("Side",),
+        ShapeType.OCTAGON: ("Side",),
+        ShapeType.STAR: ("Outer Radius", "Inner Radius"),
+        ShapeType.SPHERE: ("Radius",),
+        ShapeType.CUBE: ("Side",),
+        ShapeType.CYLINDER: ("Radius", "Height"),
+        ShapeType.CONE: ("Radius", "Height"),
+        ShapeType.PYRAMID: ("Base", "Height"),
+    }
+    _MAX_FIELDS = max(map(len, SHAPE_FIELDS.values()))
+
+    # Named colors offered in the menus, built once instead of on every calculation
+    SHAPE_COLORS = {
+        "Red": QColor(0xF4, 0x43, 0x36),
+        "Green": QColor(0x4C, 0xAF, 0x50),
+        "Blue": QColor(0x21, 0x96, 0xF3),
+        "Yellow": QColor(0xFF, 0xEB, 0x3B),
+        "Purple": QColor(0x9C, 0x27, 0xB0),
+        "Orange": QColor(0xFF, 0x98, 0x00),
+    }
+    DEFAULT_SHAPE_COLOR = QColor(0x4F, 0xC3, 0xF7)
+    ASTRO_COLORS = {
+        "Planet": QColor(0x4C, 0xAF, 0x50),  # Green
+        "Star": QColor(0xFF, 0xC1, 0x07),  # Amber
+        "Moon": QColor(0xE0, 0xE0, 0xE0),  # Light gray
+        "Gas Giant": QColor(0xFF, 0x98, 0x00),  # Orange
+        "Black Hole": QColor(0x21, 0x21, 0x21),  # Very dark gray
+    }
+    DEFAULT_ASTRO_COLOR = QColor(0x88, 0x88, 0x88)  # Default gray
+
+    HISTORY_LIMIT = 20  # calculations kept in the history list
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("🌌 Geometric Universe Explorer")
@@ -1011,10 +353,15 @@ class GeometryApp(QWidget):
         # Initialize attributes
         self.current_shape = None
         self.astro_object = None
-        self.history = []  # Store calculation history
+        # Store calculation history; the oldest entries drop off once the limit is reached
+        self.history = deque(maxlen=self.HISTORY_LIMIT)
         self.current_theme = ThemeType.COSMIC
         self.animation_timer = QTimer()
         self.animation_timer.timeout.connect(self.animate)
+        # Coalesces a burst of resize events into one redraw
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self.redraw_after_resize)
         self.animation_angle = 0.0
         self.animation_speed = 1.0
         self.current_shape_tab = 0  # Track which shape tab is active (0=2D, 1=3D)
@@ -1022,6 +369,20 @@ class GeometryApp(QWidget):
         # Visualization state
         self.grid_visible = True
         self.view_scale = 1.0
+        self._shape_items = []  # items of the drawn shape, moved together during animation
+        self._shape_origin = (0.0, 0.0)  # point _shape_items were drawn around
+        self._draw_key = None  # (type, params, scale, rgba) that _shape_items were drawn with
+        self._culled_draw = None  # (draw key, color) of a shape calculate() left off-scene
+        self._layout = None  # _Layout of the last calculate(), reused by display_results()
+        self._last_calc_key = None  # calculation_key() of the drawing on screen
+        self._astro_items = []  # items of the drawn astronomical object
+        self._grid_items = ()  # (grid, axes) path items, updated in place
+        self._marker_items = []  # center markers, labels and link line, moved in place
+        self._orbit_item = None
+
+        # Input rows (label, entry) reused across shape changes
+        self._input_rows = []
+        self._param_entries = []
 
         # Initialize UI
         self.setup_ui()
@@ -1114,12 +475,7 @@ class GeometryApp(QWidget):
         shape_2d_type_row.addWidget(QLabel("2D Shape Type:"))
         self.shape_2d_menu = QComboBox()
         # Add only 2D shapes
-        self.shape_2d_menu.addItems([
-            ShapeType.CIRCLE.value, ShapeType.RECTANGLE.value, ShapeType.TRIANGLE.value,
-            ShapeType.SQUARE.value, ShapeType.ELLIPSE.value, ShapeType.PARALLELOGRAM.value,
-            ShapeType.RHOMBUS.value, ShapeType.PENTAGON.value, ShapeType.HEXAGON.value,
-            ShapeType.OCTAGON.value, ShapeType.STAR.value
-        ])
+        self.shape_2d_menu.addItems(self.SHAPES_2D)
         self.shape_2d_menu.currentIndexChanged.connect(self.update_input_fields)
         shape_2d_menu_tip = "Choose which 2D shape to create. Parameters will update below."
         self.shape_2d_menu.setToolTip(shape_2d_menu_tip)
@@ -1143,10 +499,7 @@ class GeometryApp(QWidget):
         shape_3d_type_row.addWidget(QLabel("3D Shape Type:"))
         self.shape_3d_menu = QComboBox()
         # Add only 3D shapes
-        self.shape_3d_menu.addItems([
-            ShapeType.SPHERE.value, ShapeType.CUBE.value, ShapeType.CYLINDER.value,
-            ShapeType.CONE.value, ShapeType.PYRAMID.value
-        ])
+        self.shape_3d_menu.addItems(self.SHAPES_3D)
         self.shape_3d_menu.currentIndexChanged.connect(self.update_input_fields)
         self.shape_3d_menu.setToolTip("Choose a 3D shape for volume/surface calculations.")
         shape_3d_type_row.addWidget(self.shape_3d_menu)
@@ -1190,6 +543,8 @@ class GeometryApp(QWidget):
         self.opacity_slider.setMaximum(100)
         self.opacity_slider.setValue(100)
         self.opacity_slider.setToolTip("Adjust shape opacity for better visualization when overlapping.")
+        self.opacity_slider.sliderPressed.connect(self.begin_interactive_adjust)
+        self.opacity_slider.sliderReleased.connect(self.end_interactive_adjust)
         opacity_row.addWidget(self.opacity_slider)
         color_layout.addLayout(opacity_row)
 
@@ -1219,6 +574,8 @@ class GeometryApp(QWidget):
         astro_params_row.addWidget(QLabel("Radius:"))
         self.astro_radius_entry = QLineEdit()
         self.astro_radius_entry.setPlaceholderText("50-200")
+        self.astro_radius_entry.setValidator(
+            QRegularExpressionValidator(QRegularExpression(_NUMBER_PATTERN), self))
         astro_params_row.addWidget(self.astro_radius_entry)
         astro_group_layout.addLayout(astro_params_row)
 
@@ -1232,7 +589,7 @@ class GeometryApp(QWidget):
         alignment_row = QHBoxLayout()
         alignment_row.addWidget(QLabel("Alignment:"))
         self.align_menu = QComboBox()
-        self.align_menu.addItems([align.value for align in AlignmentType])
+        self.align_menu.addItems(list(AlignmentType))
         alignment_row.addWidget(self.align_menu)
         astro_group_layout.addLayout(alignment_row)
 
@@ -1259,6 +616,8 @@ class GeometryApp(QWidget):
         self.speed_slider.setMaximum(10)
         self.speed_slider.setValue(5)
         self.speed_slider.valueChanged.connect(self.update_animation_speed)
+        self.speed_slider.sliderPressed.connect(self.begin_interactive_adjust)
+        self.speed_slider.sliderReleased.connect(self.end_interactive_adjust)
         speed_row.addWidget(self.speed_slider)
         anim_layout.addLayout(speed_row)
         self.speed_label = QLabel("Medium") 
@@ -1314,6 +673,17 @@ class GeometryApp(QWidget):
         log_scale_row.addStretch()
         theme_layout.addLayout(log_scale_row)
 
+        # Modal dialogs during calculation (off = report in the status line only)
+        popup_row = QHBoxLayout()
+        popup_row.addWidget(QLabel("Show Pop-up Messages:"))
+        self.popup_checkbox = QCheckBox()
+        self.popup_checkbox.setChecked(True)
+        self.popup_checkbox.setToolTip("Show dialogs for calculation errors and very large values; "
+                                       "when off, they are reported in the status line without blocking")
+        popup_row.addWidget(self.popup_checkbox)
+        popup_row.addStretch()
+        theme_layout.addLayout(popup_row)
+
         theme_group.setLayout(theme_layout)
         settings_layout.addWidget(theme_group)
 
@@ -1422,6 +792,13 @@ class GeometryApp(QWidget):
         self.grid_toggle_action.setToolTip("Toggle background grid")
         self.toolbar.addAction(self.grid_toggle_action)
 
+        # Antialiasing toggle (off = faster redraws)
+        self.smooth_toggle_action = QAction("Smooth", self, checkable=True)
+        self.smooth_toggle_action.setChecked(True)
+        self.smooth_toggle_action.triggered.connect(self.toggle_antialiasing)
+        self.smooth_toggle_action.setToolTip("Toggle antialiased rendering (off redraws faster)")
+        self.toolbar.addAction(self.smooth_toggle_action)
+
         right_layout.addWidget(self.toolbar)
 
         # Visualization title
@@ -1433,11 +810,17 @@ class GeometryApp(QWidget):
 
         # Graphics area
         self.scene = QGraphicsScene()
+        # The scene holds only a handful of items, so a BSP index costs more than it saves
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.view = QGraphicsView(self.scene)
         self.view.setMinimumSize(800, 600)
         self.view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.view.setRenderHint(QPainter.Antialiasing)
-        self.view.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
+        # Redraws touch most of the canvas; repaint it whole instead of tracking damage
+        self.view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Only stock items are drawn and they restore the painter themselves
+        self.view.setOptimizationFlags(QGraphicsView.DontSavePainterState |
+                                       QGraphicsView.DontAdjustForAntialiasing)
         self.view.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         right_layout.addWidget(self.view)
 
@@ -1723,124 +1106,32 @@ class GeometryApp(QWidget):
 
     def setup_input_fields(self):
         """Setup the input fields based on current shape selection."""
-        # Clear existing fields
-        for i in reversed(range(self.inputs_layout.count())):
-            item = self.inputs_layout.itemAt(i)
-            if item.layout():
-                # Clear layout and its widgets
-                child_layout = item.layout()
-                for j in reversed(range(child_layout.count())):
-                    w_item = child_layout.itemAt(j)
-                    if w_item.widget():
-                        w_item.widget().deleteLater()
-                self.inputs_layout.removeItem(item)
-            elif item.widget():
-                # Remove widget directly
-                item.widget().deleteLater()
-
-        shape_type = self.get_current_shape_type()
-
-        # Add appropriate input fields based on shape type
-        if shape_type in [ShapeType.CIRCLE, ShapeType.SPHERE]:
-            # One parameter needed - radius
-            field_layout = QHBoxLayout()
-            field_layout.addWidget(QLabel("Radius:"))
-            entry = QLineEdit()
-            entry.setPlaceholderText("Enter radius (0-1,000,000)")
-            entry.setToolTip("Positive numeric value required.")
-            field_layout.addWidget(entry)
-            self.inputs_layout.addLayout(field_layout)
-
-        elif shape_type in [ShapeType.SQUARE, ShapeType.CUBE, ShapeType.PENTAGON,
-                           ShapeType.HEXAGON, ShapeType.OCTAGON]:
-            # One parameter needed - side
-            param_name = "Side"
-            field_layout = QHBoxLayout()
-            field_layout.addWidget(QLabel(f"{param_name}:"))
-            entry = QLineEdit()
-            entry.setPlaceholderText(f"Enter {param_name.lower()} (0-1,000,000)")
-            entry.setToolTip("Positive numeric value required.")
-            field_layout.addWidget(entry)
-            self.inputs_layout.addLayout(field_layout)
-
-        elif shape_type == ShapeType.STAR:
-            # Two parameters needed
-            field_layout1 = QHBoxLayout()
-            field_layout1.addWidget(QLabel("Outer Radius:"))
-            entry1 = QLineEdit()
-            entry1.setPlaceholderText("Enter outer radius (0-1,000,000)")
-            entry1.setToolTip("Outer radius (positive number)")
-            field_layout1.addWidget(entry1)
-            self.inputs_layout.addLayout(field_layout1)
-
-            field_layout2 = QHBoxLayout()
-            field_layout2.addWidget(QLabel("Inner Radius:"))
-            entry2 = QLineEdit()
-            entry2.setPlaceholderText("Enter inner radius (0-1,000,000)")
-            entry2.setToolTip("Inner radius (positive number)")
-            field_layout2.addWidget(entry2)
-            self.inputs_layout.addLayout(field_layout2)
-
-        elif shape_type in [ShapeType.RECTANGLE, ShapeType.TRIANGLE, ShapeType.ELLIPSE,
-                           ShapeType.RHOMBUS, ShapeType.CYLINDER, ShapeType.CONE,
-                           ShapeType.PYRAMID]:
-            # Two parameters needed
-            if shape_type == ShapeType.RECTANGLE:
-                param1, param2 = "Width", "Height"
-            elif shape_type == ShapeType.TRIANGLE:
-                param1, param2 = "Base", "Height"
-            elif shape_type == ShapeType.ELLIPSE:
-                param1, param2 = "Major axis", "Minor axis"
-            elif shape_type == ShapeType.RHOMBUS:
-                param1, param2 = "Diagonal 1", "Diagonal 2"
-            elif shape_type == ShapeType.CYLINDER:
-                param1, param2 = "Radius", "Height"
-            elif shape_type == ShapeType.CONE:
-                param1, param2 = "Radius", "Height"
-            elif shape_type == ShapeType.PYRAMID:
-                param1, param2 = "Base", "Height"
-
-            field_layout1 = QHBoxLayout()
-            field_layout1.addWidget(QLabel(f"{param1}:"))
-            entry1 = QLineEdit()
-            entry1.setPlaceholderText(f"Enter {param1.lower()} (0-1,000,000)")
-            entry1.setToolTip(f"{param1} (positive number)")
-            field_layout1.addWidget(entry1)
-            self.inputs_layout.addLayout(field_layout1)
-
-            field_layout2 = QHBoxLayout()
-            field_layout2.addWidget(QLabel(f"{param2}:"))
-            entry2 = QLineEdit()
-            entry2.setPlaceholderText(f"Enter {param2.lower()} (0-1,000,000)")
-            entry2.setToolTip(f"{param2} (positive number)")
-            field_layout2.addWidget(entry2)
-            self.inputs_layout.addLayout(field_layout2)
-
-        elif shape_type == ShapeType.PARALLELOGRAM:
-            # Three parameters needed
-            field_layout1 = QHBoxLayout()
-            field_layout1.addWidget(QLabel("Base:"))
-            entry1 = QLineEdit()
-            entry1.setPlaceholderText("Enter base (0-1,000,000)")
-            entry1.setToolTip("Base (positive number)")
-            field_layout1.addWidget(entry1)
-            self.inputs_layout.addLayout(field_layout1)
-
-            field_layout2 = QHBoxLayout()
-            field_layout2.addWidget(QLabel("Side:"))
-            entry2 = QLineEdit()
-            entry2.setPlaceholderText("Enter side (0-1,000,000)")
-            entry2.setToolTip("Side (positive number)")
-            field_layout2.addWidget(entry2)
-            self.inputs_layout.addLayout(field_layout2)
-
-            field_layout3 = QHBoxLayout()
-            field_layout3.addWidget(QLabel("Height:"))
-            entry3 = QLineEdit()
-            entry3.setPlaceholderText("Enter height (0-1,000,000)")
-            entry3.setToolTip("Height (positive number)")
-            field_layout3.addWidget(entry3)
-            self.inputs_layout.addLayout(field_layout3)
+        # Build the pool of labelled rows once; shape changes only relabel them
+        if not self._input_rows:
+            self._list_validator = QRegularExpressionValidator(
+                QRegularExpression(_NUMBER_LIST_PATTERN), self)
+            for _ in range(self._MAX_FIELDS):
+                field_layout = QHBoxLayout()
+                label = QLabel()
+                entry = QLineEdit()
+                entry.setValidator(self._list_validator)
+                field_layout.addWidget(label)
+                field_layout.addWidget(entry)
+                self.inputs_layout.addLayout(field_layout)
+                self._input_rows.append((label, entry))
+
+        # Show one row per parameter of the selected shape and hide the rest
+        fields = self.SHAPE_FIELDS[self.get_current_shape_type()]
+        for i, (label, entry) in enumerate(self._input_rows):
+            entry.clear()
+            if i < len(fields):
+                param = fields[i]
+                label.setText(f"{param}:")
+                entry.setPlaceholderText(f"Enter {param.lower()} (0-1,000,000)")
+                entry.setToolTip(f"{param} (positive number)")
+            label.setVisible(i < len(fields))
+            entry.setVisible(i < len(fields))
+        self._param_entries = [entry for _, entry in self._input_rows[:len(fields)]]
 
     def update_input_fields(self):
         """Update the input fields when shape selection changes."""
@@ -1875,99 +1166,78 @@ class GeometryApp(QWidget):
         shape_type = self.get_current_shape_type()
         params = []
 
-        # Collect all numeric values from input fields
-        for i in range(self.inputs_layout.count()):
-            layout = self.inputs_layout.itemAt(i)
-            # The stored items are QHBoxLayout typically
-            try:
-                if isinstance(layout, QHBoxLayout) or layout is None:
-                    # In some PyQt versions, itemAt returns a QLayoutItem; handle generically
-                    # Extract widget at position 1 if present
-                    row = self.inputs_layout.itemAt(i)
-                    inner = row.layout() if row.layout() else None
-                    target_layout = inner if inner else row
-                    if target_layout:
-                        # Look for QLineEdit child
-                        for j in range(target_layout.count()):
-                            w = target_layout.itemAt(j).widget()
-                            if isinstance(w, QLineEdit) and w.text():
-                                try:
-                                    param_value = float(w.text())
-                                    if param_value <= 0:
-                                        raise ValueError("All values must be positive")
-                                    if param_value > 1000000:
-                                        # Show warning but allow the value
-                                        reply = QMessageBox.question(self, "Very Large Value",
-                                                                     f"Value {param_value:,.0f} is very large. This may cause visualization issues. Continue?",
-                                                                     QMessageBox.Yes | QMessageBox.No)
-                                        if reply == QMessageBox.No:
-                                            return []
-                                    params.append(param_value)
-                                except ValueError:
-                                    raise ValueError(f"Invalid number: {w.text()}")
-                                break
-            except Exception:
-                # Fallback: ignore layout parsing errors
-                continue
+        # Collect all numeric values from the current shape's input fields
+        # (a field may also hold several comma-separated values, e.g. "3, 4")
+        for entry in self._param_entries:
+            for param_value in _parse_values(entry):
+                if param_value <= 0:
+                    raise ValueError("All values must be positive")
+                params.append(param_value)
 
         # Validate parameter count
-        required_params = 1
-        if shape_type in [ShapeType.RECTANGLE, ShapeType.TRIANGLE, ShapeType.ELLIPSE,
-                          ShapeType.RHOMBUS, ShapeType.STAR, ShapeType.CYLINDER,
-                          ShapeType.CONE, ShapeType.PYRAMID]:
-            required_params = 2
-        elif shape_type == ShapeType.PARALLELOGRAM:
-            required_params = 3
+        required_params = len(self.SHAPE_FIELDS[shape_type])
 
         if len(params) != required_params:
             raise ValueError(f"This shape requires {required_params} parameters")
 
+        # Warn once about all very large values, but allow them
+        large = [value for value in params if value > 1000000]
+        if large and self.popup_checkbox.isChecked():
+            listed = "; ".join(f"{value:,.0f}" for value in large)  # "," is the digit separator
+            noun = "Value" if len(large) == 1 else "Values"
+            verb = "is" if len(large) == 1 else "are"
+            reply = QMessageBox.question(self, "Very Large Value",
+                                         f"{noun} {listed} {verb} very large. This may cause visualization issues. Continue?",
+                                         QMessageBox.Yes | QMessageBox.No)
+            if reply == QMessageBox.No:
+                return []
+
         return params
 
     def get_shape_color(self):
         """Get the selected shape color."""
         color_name = self.color_combo.currentText()
 
-        if color_name == "Default":
-            return None
-        elif color_name == "Red":
-            return QColor("#F44336")
-        elif color_name == "Green":
-            return QColor("#4CAF50")
-        elif color_name == "Blue":
-            return QColor("#2196F3")
-        elif color_name == "Yellow":
-            return QColor("#FFEB3B")
-        elif color_name == "Purple":
-            return QColor("#9C27B0")
-        elif color_name == "Orange":
-            return QColor("#FF9800")
-        elif color_name == "Custom...":
+        if color_name == "Custom...":
             # Open color dialog for custom color selection
             color = QColorDialog.getColor()
             return color if color.isValid() else None
 
-        return None
+        # Shared instance; callers copy it before changing it ("Default" maps to None)
+        return self.SHAPE_COLORS.get(color_name)
 
     def get_astro_color(self):
         """Get color for astronomical object based on selection."""
         astro_type = self.astro_menu.currentText()
 
-        if astro_type == "Planet":
-            return "#4CAF50"  # Green
-        elif astro_type == "Star":
-            return "#FFC107"  # Amber
-        elif astro_type == "Moon":
-            return "#E0E0E0"  # Light gray
-        elif astro_type == "Gas Giant":
-            return "#FF9800"  # Orange
-        elif astro_type == "Black Hole":
-            return "#212121"  # Very dark gray
-        else:
-            return "#888888"  # Default gray
+        return self.ASTRO_COLORS.get(astro_type, self.DEFAULT_ASTRO_COLOR)
+
+    def calculation_key(self):
+        """Return every input calculate() draws from, or None if a redraw must not be skipped.
+
+        Random alignment and a custom color give a different result on every run,
+        so they never match an earlier calculation.
+        """
+        astro_name = self.astro_menu.currentText()
+        alignment_name = self.align_menu.currentText()
+        color_name = self.color_combo.currentText()
+        if color_name == "Custom..." or (astro_name != "None" and alignment_name == AlignmentType.RANDOM):
+            return None
+        scene_rect = self.scene.sceneRect()
+        return (self.get_current_shape_type(), tuple(entry.text() for entry in self._param_entries),
+                astro_name, self.astro_radius_entry.text(), self.rings_checkbox.isChecked(),
+                alignment_name, color_name, self.opacity_slider.value(), self.scale_spinbox.value(),
+                self.log_scale_checkbox.isChecked(), self.anim_checkbox.isChecked(),
+                self.grid_visible, self.current_theme,
+                round(scene_rect.width()), round(scene_rect.height()))
 
     def calculate(self):
         """Main calculation and drawing method."""
+        # Nothing to do if every input matches the drawing already on screen
+        calc_key = self.calculation_key()
+        if calc_key is not None and calc_key == self._last_calc_key:
+            return
+
         try:
             # Get shape parameters and create shape
             shape_type = self.get_current_shape_type()
@@ -1977,7 +1247,7 @@ class GeometryApp(QWidget):
 
             shape_color = self.get_shape_color()
             # If opacity adjusted, incorporate into color's alpha
-            base_color = shape_color if shape_color else QColor("#4FC3F7")
+            base_color = QColor(shape_color if shape_color else self.DEFAULT_SHAPE_COLOR)
             alpha = int(self.opacity_slider.value() * 2.55)  # map 0-100 to 0-255
             base_color.setAlpha(alpha)
 
@@ -1986,9 +1256,9 @@ class GeometryApp(QWidget):
             # Create astronomical object if selected
             self.astro_object = None
             if self.astro_menu.currentText() != "None":
-                if not self.astro_radius_entry.text():
+                astro_radius = _parse_entry(self.astro_radius_entry)
+                if astro_radius is None:
                     raise ValueError("Please enter astronomical object radius")
-                astro_radius = float(self.astro_radius_entry.text())
                 if astro_radius <= 0:
                     raise ValueError("Astronomical radius must be positive")
 
@@ -2004,78 +1274,160 @@ class GeometryApp(QWidget):
                 scene_rect = QRectF(0, 0, self.view.width(), self.view.height())
                 self.scene.setSceneRect(scene_rect)
 
-            scale = self.calculate_scale(scene_rect) * self.scale_spinbox.value()
-            alignment = AlignmentType(self.align_menu.currentText()) if self.astro_object else AlignmentType.CENTER
-
-            # Calculate positions
-            if self.astro_object:
-                astro_x, astro_y = scene_rect.width() / 2, scene_rect.height() / 2
-                shape_x, shape_y = self.astro_object.calculate_alignment_position(
-                    self.current_shape, alignment, scene_rect, scale)
-            else:
-                astro_x = astro_y = None
-                shape_x, shape_y = scene_rect.width() / 2, scene_rect.height() / 2
-
-            # Draw everything
-            self.scene.clear()
+            # Kept for display_results(), which reports on this exact layout
+            self._layout = layout = self._compute_layout(scene_rect)
+            scale, alignment = layout.scale, layout.alignment
+            astro_x, astro_y = layout.astro_pos
+            shape_x, shape_y = layout.shape_pos
+
+            # Take down the previous drawing, keeping the shape items for reuse by the new
+            # shape; the grid and markers stay in the scene and are updated in place
+            recycled = self._shape_items
+            for item in recycled + self._astro_items:
+                self.scene.removeItem(item)
+            if self._orbit_item is not None:
+                self.scene.removeItem(self._orbit_item)
+            self._shape_items = []
+            self._astro_items = []
+            self._orbit_item = None
 
             # Add a subtle grid to the background (if enabled)
             if self.grid_visible:
                 self.draw_grid(scene_rect)
-
-            if self.astro_object:
-                self.astro_object.draw(self.scene, astro_x, astro_y, scale)
-            self.current_shape.draw(self.scene, shape_x, shape_y, scale, base_color)
+            else:
+                for item in self._grid_items:
+                    item.setVisible(False)
+
+            # Skip drawing anything whose bounding box falls entirely outside the scene.
+            # This tests the scene rect rather than the viewport: panning and zooming do
+            # not rerun calculate(), so items culled against the viewport would stay
+            # missing once scrolled into view.
+            visible_rect = (0, 0, scene_rect.width(), scene_rect.height())
+            if self.astro_object and rects_overlap(visible_rect, layout.astro_bb):
+                self._astro_items = self.astro_object.draw(self.scene, astro_x, astro_y, scale)
+            draw_key = (shape_type, tuple(params), scale, base_color.rgba())
+            if rects_overlap(visible_rect, layout.shape_bb):
+                self._culled_draw = None
+                self.place_shape(recycled, draw_key, base_color, shape_x, shape_y, scale)
+            else:
+                # The orbit may still cross the scene, so animate() draws it on demand
+                self._culled_draw = (draw_key, base_color)
 
             # Add position markers and connection line
             if self.astro_object:
-                # Draw center markers
-                self.scene.addEllipse(astro_x-3, astro_y-3, 6, 6, QPen(Qt.green, 2))
-                self.scene.addEllipse(shape_x-3, shape_y-3, 6, 6, QPen(Qt.red, 2))
-
-                # Add labels
-                astro_text = self.scene.addText("Center")
-                astro_text.setDefaultTextColor(Qt.darkGreen)
-                astro_text.setPos(astro_x + 10, astro_y - 15)
-
-                shape_text = self.scene.addText("Shape")
-                shape_text.setDefaultTextColor(Qt.darkRed)
-                shape_text.setPos(shape_x + 10, shape_y - 15)
-
-                # Draw line between centers
-                self.scene.addLine(astro_x, astro_y, shape_x, shape_y, QPen(Qt.blue, 1, Qt.DashLine))
+                self.place_markers(astro_x, astro_y, shape_x, shape_y)
+            else:
+                for item in self._marker_items:
+                    item.setVisible(False)
 
             # Calculate and display results
             self.display_results()
 
             # Add to history
-            self.add_to_history()
-
-            # Update info label
-            alignment_name = alignment.value if self.astro_object else "Center"
-            scale_info = f"{scale:.6f}" if scale < 0.001 else f"{scale:.4f}"
-            self.info_label.setText(
-                f"• Shape: {shape_type.value}\n"
-                f"• Celestial Body: {self.astro_menu.currentText() if self.astro_object else 'None'}\n"
-                f"• Alignment: {alignment_name}\n"
-                f"• Scale: {scale_info} px/unit\n"
-                f"• Logarithmic Scale: {'Yes' if self.log_scale_checkbox.isChecked() else 'No'}"
-            )
+            self.add_to_history(params)
 
-            self.status_label.setText("✅ Calculation completed successfully!")
+        except (ValueError, TypeError, KeyError) as e:
+            self._last_calc_key = None
+            _set_text(self.status_label, f"❌ Error: {str(e)}")
+            if self.popup_checkbox.isChecked():
+                self.show_error_message(str(e))
+            return
+        except Exception as e:
+            # An exception escaping a Qt slot aborts the app, so report anything else here
+            self._last_calc_key = None
+            _set_text(self.status_label, f"❌ Unexpected error: {str(e)}")
+            if self.popup_checkbox.isChecked():
+                self.show_error_message(f"Unexpected error: {str(e)}")
+            return
+        # Taken afresh: the first calculation may have just sized the scene
+        self._last_calc_key = self.calculation_key()
+
+        # Update info label
+        alignment_name = alignment.value if self.astro_object else "Center"
+        scale_info = f"{scale:.6f}" if scale < 0.001 else f"{scale:.4f}"
+        _set_text(self.info_label,
+            f"• Shape: {shape_type.value}\n"
+            f"• Celestial Body: {self.astro_menu.currentText() if self.astro_object else 'None'}\n"
+            f"• Alignment: {alignment_name}\n"
+            f"• Scale: {scale_info} px/unit\n"
+            f"• Logarithmic Scale: {'Yes' if self.log_scale_checkbox.isChecked() else 'No'}"
+        )
 
-            # Update view zoom label
-            self.zoom_label.setText(f"Zoom: {int(self.view_scale * 100)}%")
+        _set_text(self.status_label, "✅ Calculation completed successfully!")
 
-            # Start animation if enabled
-            if self.anim_checkbox.isChecked():
-                # Timer interval adjusted by speed for smoother control
-                interval = max(16, int(200 / max(1, self.animation_speed * 2)))
-                self.animation_timer.start(interval)
+        # Update view zoom label
+        _set_text(self.zoom_label, f"Zoom: {int(self.view_scale * 100)}%")
 
-        except Exception as e:
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.show_error_message(str(e))
+        # Start animation if enabled
+        if self.anim_checkbox.isChecked():
+            # Timer interval adjusted by speed for smoother control
+            interval = max(16, int(200 / max(1, self.animation_speed * 2)))
+            self.animation_timer.start(interval)
+
+    def place_markers(self, astro_x, astro_y, shape_x, shape_y):
+        """Show the center markers, labels and connection line at the given centers.
+
+        The items are created on first use and then only moved, so redraws do not
+        rebuild them.
+        """
+        if not self._marker_items:
+            # Draw center markers
+            astro_marker = self.scene.addEllipse(0, 0, 6, 6, _ASTRO_MARKER_PEN)
+            shape_marker = self.scene.addEllipse(0, 0, 6, 6, _SHAPE_MARKER_PEN)
+
+            # Add labels; plain text items, the labels need no rich-text document
+            astro_text = QGraphicsSimpleTextItem("Center")
+            astro_text.setBrush(Qt.darkGreen)
+            self.scene.addItem(astro_text)
+            shape_text = QGraphicsSimpleTextItem("Shape")
+            shape_text.setBrush(Qt.darkRed)
+            self.scene.addItem(shape_text)
+
+            # Draw line between centers
+            link_line = self.scene.addLine(0, 0, 0, 0, _LINK_PEN)
+            self._marker_items = [astro_marker, shape_marker, astro_text, shape_text, link_line]
+            # Above the astro body and flat 3D faces (z 0), below the shapes (z >= 0.5)
+            for item in self._marker_items:
+                item.setZValue(0.25)
+
+        astro_marker, shape_marker, astro_text, shape_text, link_line = self._marker_items
+        astro_marker.setRect(astro_x-3, astro_y-3, 6, 6)
+        shape_marker.setRect(shape_x-3, shape_y-3, 6, 6)
+        # Offsets include the 4px margin the old QGraphicsTextItem labels had
+        astro_text.setPos(astro_x + 14, astro_y - 11)
+        shape_text.setPos(shape_x + 14, shape_y - 11)
+        link_line.setLine(astro_x, astro_y, shape_x, shape_y)
+        for item in self._marker_items:
+            item.setVisible(True)
+
+    def place_shape(self, recycled, draw_key, color, shape_x, shape_y, scale):
+        """Draw the current shape centered at (shape_x, shape_y), reusing recycled items.
+
+        When draw_key matches the last drawing, the recycled items are only put back
+        and shifted.
+        """
+        if recycled and draw_key == self._draw_key:
+            # Same geometry and style as last time: put the items back and shift them
+            origin_x, origin_y = self._shape_origin
+            for item in recycled:
+                self.scene.addItem(item)
+                item.setPos(shape_x - origin_x, shape_y - origin_y)
+            self._shape_items = recycled
+        else:
+            target = _ItemRecycler(self.scene, recycled) if recycled else self.scene
+            self._shape_items = self.current_shape.draw(target, shape_x, shape_y, scale, color)
+            self._shape_origin = (shape_x, shape_y)
+            self._draw_key = draw_key
+
+    def clear_scene(self):
+        """Remove all items from the scene and forget references to them."""
+        self.scene.clear()
+        self._shape_items = []
+        self._culled_draw = None
+        self._astro_items = []
+        self._grid_items = ()
+        self._marker_items = []
+        self._orbit_item = None
 
     def show_error_message(self, message):
         """Show an error message with proper styling that works in all themes."""
@@ -2113,27 +1465,40 @@ class GeometryApp(QWidget):
     def draw_grid(self, scene_rect):
         """Draw a subtle grid in the background."""
         theme = ThemeManager.get_theme(self.current_theme)
-        grid_color = QColor(theme['grid'])
-        grid_color.setAlpha(100)  # Semi-transparent
-
-        width = int(scene_rect.width())
-        height = int(scene_rect.height())
-
-        # Draw horizontal lines
-        step = 50
-        for y in range(0, height, step):
-            self.scene.addLine(0, y, width, y, QPen(grid_color, 0.5))
-
-        # Draw vertical lines
-        for x in range(0, width, step):
-            self.scene.addLine(x, 0, x, height, QPen(grid_color, 0.5))
-
-        # Draw axes
-        center_x = width / 2
-        center_y = height / 2
-        axis_color = QColor(150, 150, 150, 160)
-        self.scene.addLine(0, center_y, width, center_y, QPen(axis_color, 1))
-        self.scene.addLine(center_x, 0, center_x, height, QPen(axis_color, 1))
+        grid_pen = _grid_pen(theme['grid'])
+
+        grid_path, axis_path = _grid_paths(int(scene_rect.width()), int(scene_rect.height()))
+        if not self._grid_items:
+            grid_item = self.scene.addPath(grid_path, grid_pen)
+            # Draw axes
+            axis_item = self.scene.addPath(axis_path, _AXIS_PEN)
+            # Behind everything but the orbit path (z -1)
+            grid_item.setZValue(-0.5)
+            axis_item.setZValue(-0.5)
+            self._grid_items = (grid_item, axis_item)
+        else:
+            # Reuse the grid items; the size and theme may have changed since
+            grid_item, axis_item = self._grid_items
+            grid_item.setPath(grid_path)
+            grid_item.setPen(grid_pen)
+            axis_item.setPath(axis_path)
+            grid_item.setVisible(True)
+            axis_item.setVisible(True)
+
+    def _compute_layout(self, scene_rect):
+        """Return the _Layout of the current shape and astro object in scene_rect."""
+        scale = self.calculate_scale(scene_rect) * self.scale_spinbox.value()
+        center_x, center_y = scene_rect.width() / 2, scene_rect.height() / 2
+        if not self.astro_object:
+            return _Layout(scale, AlignmentType.CENTER, (None, None), (center_x, center_y),
+                           None, self.current_shape.bounding_box(center_x, center_y, scale))
+
+        alignment = AlignmentType(self.align_menu.currentText())
+        shape_x, shape_y = self.astro_object.calculate_alignment_position(
+            self.current_shape, alignment, scene_rect, scale)
+        return _Layout(scale, alignment, (center_x, center_y), (shape_x, shape_y),
+                       self.astro_object.bounding_box(center_x, center_y, scale),
+                       self.current_shape.bounding_box(shape_x, shape_y, scale))
 
     def calculate_scale(self, scene_rect):
         """Calculate appropriate scale to fit both shape and astronomical object."""
@@ -2154,21 +1519,14 @@ class GeometryApp(QWidget):
 
             if size_ratio > 100:  # Astronomical object is much larger
                 # Scale based on astronomical object but ensure shape is visible
-                scale_x = (scene_w * 0.4) / astro_w if astro_w > 0 else 1
-                scale_y = (scene_h * 0.4) / astro_h if astro_h > 0 else 1
+                calculated_scale = _fit_scale(scene_w, scene_h, astro_w, astro_h, 0.4)
             else:
                 # Scale based on largest object
-                max_w = max(shape_w, astro_w)
-                max_h = max(shape_h, astro_h)
-                scale_x = (scene_w * 0.8) / max_w if max_w > 0 else 1
-                scale_y = (scene_h * 0.8) / max_h if max_h > 0 else 1
+                calculated_scale = _fit_scale(scene_w, scene_h, max(shape_w, astro_w),
+                                              max(shape_h, astro_h), 0.8)
         else:
             # Scale based on shape only
-            scale_x = (scene_w * 0.8) / shape_w if shape_w > 0 else 1
-            scale_y = (scene_h * 0.8) / shape_h if shape_h > 0 else 1
-
-        # Auto-adjust scale for very large values
-        calculated_scale = min(scale_x, scale_y)
+            calculated_scale = _fit_scale(scene_w, scene_h, shape_w, shape_h, 0.8)
 
         # Apply logarithmic scaling if enabled for very large values
         if self.log_scale_checkbox.isChecked() and calculated_scale < 0.01:
@@ -2211,26 +1569,16 @@ class GeometryApp(QWidget):
         else:
             result_text += f"<b>Dimensions:</b> {w:,.1f} × {h:,.1f}<br>"
 
-        if self.astro_object:
-            # Check for overlap
-            scene_rect = self.scene.sceneRect()
-            scale = self.calculate_scale(scene_rect) * self.scale_spinbox.value()
-
-            astro_x, astro_y = scene_rect.width() / 2, scene_rect.height() / 2
-            alignment = AlignmentType(self.align_menu.currentText())
-            shape_x, shape_y = self.astro_object.calculate_alignment_position(
-                self.current_shape, alignment, scene_rect, scale)
-
-            astro_bb = self.astro_object.bounding_box(astro_x, astro_y, scale)
-            shape_bb = self.current_shape.bounding_box(shape_x, shape_y, scale)
-
-            overlap = self.check_overlap(astro_bb, shape_bb)
+        layout = self._layout
+        if self.astro_object and layout is not None:
+            # Check for overlap at the positions calculate() just drew
+            overlap = self.check_overlap(layout.astro_bb, layout.shape_bb)
             result_text += f"<b>Overlap with {self.astro_menu.currentText()}:</b> {'Yes' if overlap else 'No'}<br>"
 
-        self.result_label.setText(result_text)
+        _set_text(self.result_label, result_text)
 
-    def add_to_history(self):
-        """Add current calculation to history."""
+    def add_to_history(self, params):
+        """Add current calculation, made with the given shape parameters, to history."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         shape_name = self.current_shape.__class__.__name__
         astro_name = self.astro_menu.currentText() if self.astro_object else "None"
@@ -2241,15 +1589,12 @@ class GeometryApp(QWidget):
             'astro': astro_name,
             'result': self.result_label.text(),
             'shape_type': self.get_current_shape_type().value,
-            'shape_params': self.get_shape_parameters(),
+            'shape_params': params,
             'astro_radius': self.astro_radius_entry.text() if self.astro_object else "",
             'alignment': self.align_menu.currentText()
         }
 
         self.history.append(history_entry)
-        # Keep only last 20 entries
-        if len(self.history) > 20:
-            self.history.pop(0)
 
         # Update history list
         self.history_list.clear()
@@ -2266,11 +1611,7 @@ class GeometryApp(QWidget):
 
         # Set shape type in appropriate menu based on shape type
         shape_type = entry['shape_type']
-        if shape_type in [shape.value for shape in [
-            ShapeType.CIRCLE, ShapeType.RECTANGLE, ShapeType.TRIANGLE, ShapeType.SQUARE,
-            ShapeType.ELLIPSE, ShapeType.PARALLELOGRAM, ShapeType.RHOMBUS, ShapeType.PENTAGON,
-            ShapeType.HEXAGON, ShapeType.OCTAGON, ShapeType.STAR
-        ]]:
+        if shape_type in self.SHAPES_2D:
             # It's a 2D shape, switch to 2D tab and select the shape
             self.shape_sub_tabs.setCurrentIndex(0)
             shape_index = self.shape_2d_menu.findText(shape_type)
@@ -2308,26 +1649,13 @@ class GeometryApp(QWidget):
         # Clear existing fields first
         self.setup_input_fields()
 
-        # Set the parameter values
-        param_index = 0
-        for i in range(self.inputs_layout.count()):
-            layout = self.inputs_layout.itemAt(i)
-            if layout and isinstance(layout.layout(), QHBoxLayout):
-                target_layout = layout.layout()
-            else:
-                target_layout = layout.layout() if hasattr(layout, 'layout') and layout.layout() else layout
-            if target_layout and param_index < len(params):
-                # Find first QLineEdit in target_layout
-                for j in range(target_layout.count()):
-                    widget = target_layout.itemAt(j).widget()
-                    if isinstance(widget, QLineEdit):
-                        widget.setText(str(params[param_index]))
-                        param_index += 1
-                        break
+        # Set the parameter values, one per active entry in argument order
+        for entry, value in zip(self._param_entries, params):
+            entry.setText(str(value))
 
     def clear_history(self):
         """Clear the calculation history."""
-        self.history = []
+        self.history.clear()
         self.history_list.clear()
         self.status_label.setText("🗑️ History cleared")
 
@@ -2340,7 +1668,7 @@ class GeometryApp(QWidget):
 
             if filename:
                 with open(filename, 'w') as f:
-                    json.dump(self.history, f, indent=2)
+                    json.dump(list(self.history), f, indent=2)
 
                 self.status_label.setText(f"💾 History saved to {filename}")
 
@@ -2357,17 +1685,27 @@ class GeometryApp(QWidget):
             if not filename:
                 return
 
+            # Assemble the report first so the file gets a single write
+            shape_name = self.current_shape.__class__.__name__ if self.current_shape else 'None'
+            lines = [
+                "Geometry Calculation Results",
+                "=" * 50,
+                "",
+                f"Shape: {shape_name}",
+                f"Astronomical Object: {self.astro_menu.currentText()}",
+                f"Alignment: {self.align_menu.currentText()}",
+                "",
+                "Results:",
+                _html_to_text(self.result_label.text()),
+                "",
+                "Calculation History:",
+            ]
+            lines.extend(f"{i}. {entry['timestamp']} - {entry['shape']} with {entry['astro']}"
+                         for i, entry in enumerate(self.history, 1))
+            lines.append("")
+
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write("Geometry Calculation Results\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Shape: {self.current_shape.__class__.__name__ if self.current_shape else 'None'}\n")
-                f.write(f"Astronomical Object: {self.astro_menu.currentText()}\n")
-                f.write(f"Alignment: {self.align_menu.currentText()}\n\n")
-                f.write("Results:\n")
-                f.write(self.result_label.text().replace('<br>', '\n').replace('<b>', '').replace('</b>', '').replace('<h3>', '').replace('</h3>', ''))
-                f.write("\n\nCalculation History:\n")
-                for i, entry in enumerate(self.history, 1):
-                    f.write(f"{i}. {entry['timestamp']} - {entry['shape']} with {entry['astro']}\n")
+                f.write("\n".join(lines))
 
             self.status_label.setText(f"💾 Results saved to {filename}")
 
@@ -2380,19 +1718,11 @@ class GeometryApp(QWidget):
         self.animation_timer.stop()
 
         # Clear the graphics scene
-        self.scene.clear()
+        self.clear_scene()
 
         # Clear input fields
-        for i in range(self.inputs_layout.count()):
-            layout = self.inputs_layout.itemAt(i)
-            try:
-                inner = layout.layout() if layout.layout() else layout
-                for j in range(inner.count()):
-                    widget = inner.itemAt(j).widget()
-                    if isinstance(widget, QLineEdit):
-                        widget.clear()
-            except Exception:
-                continue
+        for _, entry in self._input_rows:
+            entry.clear()
 
         # Clear astronomical object fields
         self.astro_radius_entry.clear()
@@ -2420,6 +1750,8 @@ class GeometryApp(QWidget):
         # Reset shape and astronomical object references
         self.current_shape = None
         self.astro_object = None
+        self._layout = None
+        self._last_calc_key = None
 
         # Update status
         self.status_label.setText("🔄 All inputs cleared. Ready for new calculation.")
@@ -2445,6 +1777,15 @@ class GeometryApp(QWidget):
         if not self.astro_object or not self.current_shape:
             self.animation_timer.stop()
             return
+        if not self._shape_items:
+            if self._culled_draw is None:
+                self.animation_timer.stop()
+                return
+            # calculate() culled the shape at its static spot; draw it there to orbit it
+            draw_key, color = self._culled_draw
+            self._culled_draw = None
+            shape_x, shape_y = self._layout.shape_pos
+            self.place_shape([], draw_key, color, shape_x, shape_y, self._layout.scale)
 
         # Increment angle based on speed
         self.animation_angle += 0.05 * self.animation_speed
@@ -2452,50 +1793,36 @@ class GeometryApp(QWidget):
         # convert to radians (wrap if large)
         self.animation_angle = self.animation_angle % (2 * math.pi)
 
-        # Redraw the scene with new position
-        scene_rect = self.scene.sceneRect()
-        scale = self.calculate_scale(scene_rect) * self.scale_spinbox.value()
-
-        astro_x, astro_y = scene_rect.width() / 2, scene_rect.height() / 2
+        # Orbit at the scale and center the shape was last drawn with
+        scale = self._layout.scale
+        astro_x, astro_y = self._layout.astro_pos
 
         # Calculate orbit position
-        shape_w, shape_h, _ = self.current_shape.natural_size()
-        shape_w_px = shape_w * scale
-        astro_radius_px = self.astro_object._radius * scale
-
-        orbit_radius = astro_radius_px + shape_w_px/2 + 10  # 10px margin
-        shape_x = astro_x + orbit_radius * math.cos(self.animation_angle)
-        shape_y = astro_y + orbit_radius * math.sin(self.animation_angle)
+        orbit_radius = self.astro_object.orbit_radius(self.current_shape, scale)
+        shape_x, shape_y = orbit_point(astro_x, astro_y, orbit_radius, self.animation_angle)
 
-        # Redraw everything
-        self.scene.clear()
-        if self.grid_visible:
-            self.draw_grid(scene_rect)
-        self.astro_object.draw(self.scene, astro_x, astro_y, scale)
+        # Move the already drawn shape instead of rebuilding the whole scene each frame
+        origin_x, origin_y = self._shape_origin
+        for item in self._shape_items:
+            item.setPos(shape_x - origin_x, shape_y - origin_y)
 
-        shape_color = self.get_shape_color()
-        base_color = shape_color if shape_color else QColor("#4FC3F7")
-        alpha = int(self.opacity_slider.value() * 2.55)
-        base_color.setAlpha(alpha)
-        self.current_shape.draw(self.scene, shape_x, shape_y, scale, base_color)
+        # Position markers belong to the static layout, not to the orbit
+        for item in self._marker_items:
+            item.setVisible(False)
 
         # Draw orbit path (faint)
-        orbit = self.scene.addEllipse(
-            astro_x - orbit_radius,
-            astro_y - orbit_radius,
-            orbit_radius * 2,
-            orbit_radius * 2,
-            QPen(QColor(255, 255, 255, 100), 1, Qt.DashLine)
-        )
-        orbit.setZValue(-1)
+        orbit_rect = QRectF(astro_x - orbit_radius, astro_y - orbit_radius,
+                            orbit_radius * 2, orbit_radius * 2)
+        if self._orbit_item is None:
+            self._orbit_item = self.scene.addEllipse(
+                orbit_rect, _ORBIT_PEN)
+            self._orbit_item.setZValue(-1)
+        else:
+            self._orbit_item.setRect(orbit_rect)
 
     def check_overlap(self, rect1, rect2):
         """Check if two rectangles overlap."""
-        x1_min, y1_min, x1_max, y1_max = rect1
-        x2_min, y2_min, x2_max, y2_max = rect2
-
-        return not (x1_max < x2_min or x2_max < x1_min or
-                    y1_max < y2_min or y2_max < y1_min)
+        return rects_overlap(rect1, rect2)
 
     def resizeEvent(self, event):
         """Handle window resize events."""
@@ -2506,8 +1833,14 @@ class GeometryApp(QWidget):
             self.scene.setSceneRect(0, 0, size.width(), size.height())
             # Redraw if we have content
             if self.current_shape:
-                # Recalculate to adapt to new scene size without losing zoom transform
-                self.calculate()
+                # Recalculate to adapt to new scene size without losing zoom transform,
+                # once the window has stopped changing size for a moment
+                self._resize_timer.start(100)
+
+    def redraw_after_resize(self):
+        """Redraw for the new scene size, unless the canvas was cleared meanwhile."""
+        if self.current_shape:
+            self.calculate()
 
     # ----------------- New UX helpers -----------------
     def zoom_view(self, factor):
@@ -2517,13 +1850,13 @@ class GeometryApp(QWidget):
         self.view_scale = max(0.1, min(self.view_scale, 10.0))
         self.view.resetTransform()
         self.view.scale(self.view_scale, self.view_scale)
-        self.zoom_label.setText(f"Zoom: {int(self.view_scale * 100)}%")
+        _set_text(self.zoom_label, f"Zoom: {int(self.view_scale * 100)}%")
 
     def reset_view(self):
         """Reset zoom and pan to defaults."""
         self.view_scale = 1.0
         self.view.resetTransform()
-        self.zoom_label.setText(f"Zoom: {int(self.view_scale * 100)}%")
+        _set_text(self.zoom_label, f"Zoom: {int(self.view_scale * 100)}%")
         # Reset pan by centering the scene
         self.view.ensureVisible(self.scene.sceneRect())
 
@@ -2552,6 +1885,19 @@ class GeometryApp(QWidget):
         if self.current_shape:
             self.calculate()
 
+    def toggle_antialiasing(self, checked):
+        """Switch antialiased rendering on or off for the canvas."""
+        self.view.setRenderHint(QPainter.Antialiasing, checked)
+        self.view.viewport().update()
+
+    def begin_interactive_adjust(self):
+        """Render without antialiasing while a slider is being dragged."""
+        self.view.setRenderHint(QPainter.Antialiasing, False)
+
+    def end_interactive_adjust(self):
+        """Restore the Smooth setting once the slider is released."""
+        self.toggle_antialiasing(self.smooth_toggle_action.isChecked())
+
 # ----------------- Run -----------------
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,1068 @@
+# shapes.py
+# Shape model for the Geometric Universe Explorer: 2D/3D shapes, the astronomical
+# reference object and the shape factory. Only QtCore/QtGui are needed here (for
+# drawing); the widget layer lives in geometry.py.
+from math import pi, cos, sin, sqrt, tan, radians, hypot
+import random
+from functools import lru_cache
+from itertools import starmap
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import TYPE_CHECKING
+from PyQt5.QtGui import QPolygonF, QBrush, QPen, QColor, QTransform
+from PyQt5.QtCore import QPointF, Qt
+
+if TYPE_CHECKING:
+    from PyQt5.QtWidgets import QGraphicsScene
+
+
+# ----------------- Precomputed constants -----------------
+_PENTAGON_AREA_COEFF = 5 / (4 * tan(pi / 5))  # area / side**2
+_PENTAGON_CIRCUMRADIUS = 1 / (2 * sin(pi / 5))  # circumradius / side, ≈ 0.851
+
+
+@lru_cache(maxsize=128)
+def ellipse_perimeter(a, b, high_precision=False):
+    """Approximate perimeter of an ellipse with semi-axes a, b.
+
+    Uses Ramanujan's first approximation (one square root), which is well within
+    on-screen precision; pass high_precision=True for his second approximation.
+    Kept as a free function so batch callers can use it without building Ellipse objects.
+    Results are cached, so recalculating an unchanged ellipse skips the formula.
+    """
+    if a == b:
+        return 2 * pi * a  # a circle; both approximations reduce to this
+    if high_precision:
+        d = a - b
+        t = a + b
+        h = (d * d) / (t * t)
+        return pi * t * (1 + (3*h) / (10 + sqrt(4 - 3*h)))
+    return pi * (3 * (a + b) - sqrt((3*a + b) * (a + 3*b)))
+
+
+def pentagon_area(side):
+    """Area of a regular pentagon with the given side length."""
+    return _PENTAGON_AREA_COEFF * side * side
+
+
+@lru_cache(maxsize=64)
+def _brush_and_pen(rgba):
+    """Return a (fill brush, border pen) pair for an ARGB color, built once per color."""
+    fill_color = QColor.fromRgba(rgba)
+    return QBrush(fill_color), QPen(fill_color.darker(150), 2)
+
+
+@lru_cache(maxsize=64)
+def _shaded_brush(rgba, lighter=0, darker=0):
+    """Return a brush for an ARGB color made lighter/darker by the given Qt factors, built once."""
+    shade = QColor.fromRgba(rgba)
+    if lighter:
+        shade = shade.lighter(lighter)
+    if darker:
+        shade = shade.darker(darker)
+    return QBrush(shade)
+
+
+_NO_PEN = QPen(Qt.NoPen)
+
+
+def _require_positive(message, *values):
+    """Raise ValueError(message) unless every value is a positive number."""
+    for value in values:
+        if value is None or value <= 0:
+            raise ValueError(message)
+
+
+def _centered_box(w, h, cx, cy, scale):
+    """Pixel box (x_min, y_min, x_max, y_max) of a w x h unit-sized extent centered at (cx, cy)."""
+    w_px = w * scale
+    h_px = h * scale
+    return (cx - w_px/2, cy - h_px/2, cx + w_px/2, cy + h_px/2)
+
+
+def rects_overlap(rect1, rect2):
+    """Return True if two (x_min, y_min, x_max, y_max) boxes overlap or touch."""
+    x1_min, y1_min, x1_max, y1_max = rect1
+    x2_min, y2_min, x2_max, y2_max = rect2
+    return not (x1_max < x2_min or x2_max < x1_min or
+                y1_max < y2_min or y2_max < y1_min)
+
+
+@lru_cache(maxsize=32)
+def _unit_ring(n, start=0.0):
+    """Return the (cos, sin) of n evenly spaced angles from start (radians), computed once per n."""
+    step = 2 * pi / n
+    return tuple((cos(start + i * step), sin(start + i * step)) for i in range(n))
+
+
+def orbit_point(cx, cy, radius, angle):
+    """Return the (x, y) point at angle (radians) on a circle around (cx, cy)."""
+    return cx + radius * cos(angle), cy + radius * sin(angle)
+
+
+@lru_cache(maxsize=16)
+def _solid_brush(rgba):
+    """Return a solid brush for an ARGB color, built once per color."""
+    return QBrush(QColor.fromRgba(rgba))
+
+
+def _polygon(coords):
+    """Build a QPolygonF from (x, y) pairs, creating the points in one C-level pass."""
+    # PyQt5's QPolygonF has no reserve(), and filling a pre-sized QPolygonF(n) by index
+    # measured slower than handing the whole point list to the constructor.
+    return QPolygonF(list(starmap(QPointF, coords)))
+
+
+def _placed(unit_poly, sx, sy, dx, dy):
+    """Return a copy of a unit polygon scaled by (sx, sy) and moved to (dx, dy)."""
+    # QTransform.map() transforms every vertex in C++; the shared template is never mutated
+    return QTransform(sx, 0, 0, sy, dx, dy).map(unit_poly)
+
+# ----------------- Enums for better code readability -----------------
+# Both enums mix in str, so members compare equal to, and hash like, their menu text
+class ShapeType(str, Enum):
+    # 2D Shapes
+    CIRCLE = "Circle"
+    RECTANGLE = "Rectangle"
+    TRIANGLE = "Triangle"
+    SQUARE = "Square"
+    ELLIPSE = "Ellipse"
+    PARALLELOGRAM = "Parallelogram"
+    RHOMBUS = "Rhombus"
+    PENTAGON = "Pentagon"
+    HEXAGON = "Hexagon"
+    OCTAGON = "Octagon"
+    STAR = "Star"
+    # 3D Shapes
+    SPHERE = "Sphere"
+    CUBE = "Cube"
+    CYLINDER = "Cylinder"
+    CONE = "Cone"
+    PYRAMID = "Pyramid"
+
+
+class AlignmentType(str, Enum):
+    CENTER = "Center"
+    TOP = "Top"
+    BOTTOM = "Bottom"
+    LEFT = "Left"
+    RIGHT = "Right"
+    OVERLAP = "Overlap"
+    ORBIT = "Orbit"
+    RANDOM = "Random"
+
+
+# ----------------- Base / Abstract classes -----------------
+class Shape(ABC):
+    """Abstract base class for all shapes.
+
+    Constructors only check dimensions when __debug__ is set (not under ``python -O``);
+    the GUI validates user input before any shape is built.
+    """
+
+    __slots__ = ("_summary",)
+    _FILL = QColor(0x4F, 0xC3, 0xF7)  # default fill color, overridden per shape
+
+    @abstractmethod
+    def area(self):
+        pass
+
+    @abstractmethod
+    def perimeter(self):
+        pass
+
+    @abstractmethod
+    def volume(self):
+        """For 3D shapes, returns volume. For 2D shapes, returns 0."""
+        pass
+
+    @abstractmethod
+    def natural_size(self):
+        """Return (width, height, depth) in the shape's own units (unscaled)."""
+        pass
+
+    @abstractmethod
+    def draw(self, scene: "QGraphicsScene", cx: float, cy: float, scale: float, color: QColor = None):
+        """Draw shape centered at (cx, cy) with a scale factor (units -> pixels).
+
+        Returns the list of graphics items added to the scene.
+        """
+        pass
+
+    def _style(self, color=None):
+        """Return the cached (brush, pen) pair for color, or for the shape's default fill."""
+        fill_color = color if color else self._FILL
+        return _brush_and_pen(fill_color.rgba())
+
+    def _shade(self, color=None, lighter=0, darker=0):
+        """Return the cached brush for a lighter/darker face of color (or the default fill)."""
+        fill_color = color if color else self._FILL
+        return _shaded_brush(fill_color.rgba(), lighter, darker)
+
+    def bounding_box(self, cx: float, cy: float, scale: float):
+        """Return (x_min, y_min, x_max, y_max) in pixels for overlap detection."""
+        w, h, _ = self.natural_size()
+        return _centered_box(w, h, cx, cy, scale)
+
+    @property
+    def summary(self):
+        """One-line description of the shape, formatted on first use and then reused."""
+        try:
+            return self._summary
+        except AttributeError:
+            pass
+        try:
+            text = f"{self.__class__.__name__}: Area={self.area():.2f}, Perimeter={self.perimeter():.2f}"
+        except Exception:
+            text = f"{self.__class__.__name__}"
+        self._summary = text  # shapes are immutable once constructed
+        return text
+
+    def __str__(self):
+        """String representation of the shape with its properties."""
+        return self.summary
+
+
+class Shape2D(Shape, ABC):
+    """Abstract base class for 2D shapes."""
+
+    __slots__ = ()
+
+    def volume(self):
+        return 0  # 2D shapes have no volume
+
+
+class Shape3D(Shape, ABC):
+    """Abstract base class for 3D shapes."""
+
+    __slots__ = ()
+
+    def perimeter(self):
+        return 0  # 3D shapes typically don't have perimeter in the same sense
+
+
+# ----------------- 2D Shapes -----------------
+class Circle(Shape2D):
+    __slots__ = ("_radius", "_area", "_perimeter", "_size")
+    _FILL = QColor(0x4F, 0xC3, 0xF7)
+
+    def __init__(self, radius):
+        if __debug__:
+            _require_positive("Radius must be positive", radius)
+        self._radius = radius
+        # Shapes are immutable after construction, so compute results once
+        self._area = pi * radius * radius
+        self._perimeter = 2 * pi * radius
+        d = 2 * radius
+        self._size = (d, d, 0)  # 2D shape has depth=0
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def bounding_box(self, cx, cy, scale):
+        r = self._radius * scale
+        return (cx - r, cy - r, cx + r, cy + r)
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        diameter_px = 2 * self._radius * scale
+        x = cx - diameter_px/2
+        y = cy - diameter_px/2
+
+        brush, pen = self._style(color)
+
+        ellipse = scene.addEllipse(x, y, diameter_px, diameter_px, pen, brush)
+        ellipse.setZValue(1)
+
+        return [ellipse]
+
+
+class Rectangle(Shape2D):
+    __slots__ = ("_width", "_height", "_area", "_perimeter", "_size")
+    _FILL = QColor(0x81, 0xC7, 0x84)
+
+    def __init__(self, width, height):
+        if __debug__:
+            _require_positive("Width and height must be positive", width, height)
+        self._width = width
+        self._height = height
+        self._area = width * height
+        self._perimeter = 2 * (width + height)
+        self._size = (width, height, 0)
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        w_px = self._width * scale
+        h_px = self._height * scale
+        x = cx - w_px/2
+        y = cy - h_px/2
+
+        brush, pen = self._style(color)
+
+        rect = scene.addRect(x, y, w_px, h_px, pen, brush)
+        rect.setZValue(1)
+
+        return [rect]
+
+
+class Triangle(Shape2D):
+    __slots__ = ("_base", "_height", "_area", "_perimeter", "_size")
+    _FILL = QColor(0xFF, 0xF1, 0x76)
+    _UNIT_POLY = _polygon(((0, -0.5), (-0.5, 0.5), (0.5, 0.5)))  # in (base, height) units
+
+    def __init__(self, base, height):
+        if __debug__:
+            _require_positive("Base and height must be positive", base, height)
+        self._base = base
+        self._height = height
+        self._area = 0.5 * base * height
+        self._perimeter = base + height + hypot(base, height)
+        self._size = (base, height, 0)
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        base_px = self._base * scale
+        height_px = self._height * scale
+
+        brush, pen = self._style(color)
+
+        # center the triangle vertically at cy (apex up)
+        polygon = _placed(self._UNIT_POLY, base_px, height_px, cx, cy)
+        item = scene.addPolygon(polygon, pen, brush)
+        item.setZValue(1)
+
+        return [item]
+
+
+class Square(Rectangle):
+    """A rectangle with equal sides; area, perimeter and drawing come from Rectangle."""
+
+    __slots__ = ("_side",)
+    _FILL = QColor(0xFF, 0x8A, 0x65)
+
+    def __init__(self, side):
+        super().__init__(side, side)  # Rectangle's guard rejects a non-positive side
+        self._side = side
+
+    def bounding_box(self, cx, cy, scale):
+        h = self._side * scale / 2
+        return (cx - h, cy - h, cx + h, cy + h)
+
+
+class Ellipse(Shape2D):
+    __slots__ = ("_a", "_b", "_area", "_perimeter", "_size")
+    _FILL = QColor(0xDC, 0xE7, 0x75)
+
+    def __init__(self, a, b, high_precision=False):
+        if __debug__:
+            _require_positive("Axes must be positive", a, b)
+        a = float(a)  # plain floats keep ellipse_perimeter's cache keys uniform
+        b = float(b)
+        self._a = a  # semi-major
+        self._b = b  # semi-minor
+        self._area = pi * a * b
+        self._perimeter = ellipse_perimeter(a, b, high_precision)
+        self._size = (2 * a, 2 * b, 0)
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        w_px = 2 * self._a * scale
+        h_px = 2 * self._b * scale
+        x = cx - w_px/2
+        y = cy - h_px/2
+
+        brush, pen = self._style(color)
+
+        ellipse = scene.addEllipse(x, y, w_px, h_px, pen, brush)
+        ellipse.setZValue(1)
+
+        return [ellipse]
+
+
+class Parallelogram(Shape2D):
+    __slots__ = ("_base", "_side", "_height", "_outline", "_area", "_perimeter", "_size")
+    _FILL = QColor(0x4D, 0xD0, 0xE1)
+
+    def __init__(self, base, side, height):
+        if __debug__:
+            _require_positive("Dimensions must be positive", base, side, height)
+        self._base = base
+        self._side = side
+        self._height = height
+        # Corner offsets from the center in shape units; draw only scales and shifts them
+        half_b = base / 2
+        half_h = height / 2
+        shear = base * 0.2
+        self._outline = _polygon(((-half_b, -half_h), (half_b, -half_h),
+                                  (half_b + shear, half_h), (-half_b + shear, half_h)))
+        self._area = base * height
+        self._perimeter = 2 * (base + side)
+        self._size = (base + shear, height, 0)  # give some horizontal extra for shear
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        brush, pen = self._style(color)
+
+        polygon = _placed(self._outline, scale, scale, cx, cy)
+        item = scene.addPolygon(polygon, pen, brush)
+        item.setZValue(1)
+
+        return [item]
+
+
+class Rhombus(Shape2D):
+    __slots__ = ("_d1", "_d2", "_area", "_perimeter", "_size")
+    _FILL = QColor(0xBA, 0x68, 0xC8)
+    _UNIT_POLY = _polygon(((0, -0.5), (0.5, 0), (0, 0.5), (-0.5, 0)))  # in (d1, d2) units
+
+    def __init__(self, d1, d2):
+        if __debug__:
+            _require_positive("Diagonals must be positive", d1, d2)
+        self._d1 = d1
+        self._d2 = d2
+        self._area = (d1 * d2) / 2
+        self._perimeter = 2 * hypot(d1, d2)  # 4 sides of hypot(d1/2, d2/2)
+        self._size = (d1, d2, 0)
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        d1_px = self._d1 * scale
+        d2_px = self._d2 * scale
+
+        brush, pen = self._style(color)
+
+        polygon = _placed(self._UNIT_POLY, d1_px, d2_px, cx, cy)
+        item = scene.addPolygon(polygon, pen, brush)
+        item.setZValue(1)
+
+        return [item]
+
+
+class Pentagon(Shape2D):
+    __slots__ = ("_side", "_area", "_perimeter", "_size")
+    _FILL = QColor(0xFF, 0xB7, 0x4D)
+
+    # Unit-circle vertex offsets (apex up), computed once at import
+    _UNIT_POLY = _polygon(
+        (cos(2 * pi * i / 5 - pi/2), sin(2 * pi * i / 5 - pi/2))
+        for i in range(5)
+    )
+
+    def __init__(self, side):
+        if __debug__:
+            _require_positive("Side must be positive", side)
+        self._side = side
+        self._area = pentagon_area(side)
+        self._perimeter = 5 * side
+        # approximate bounding box using the circumradius
+        r = _PENTAGON_CIRCUMRADIUS * side
+        self._size = (2*r, 2*r, 0)
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        r_px = _PENTAGON_CIRCUMRADIUS * self._side * scale
+
+        brush, pen = self._style(color)
+
+        polygon = _placed(self._UNIT_POLY, r_px, r_px, cx, cy)
+        item = scene.addPolygon(polygon, pen, brush)
+        item.setZValue(1)
+
+        return [item]
+
+
+class Hexagon(Shape2D):
+    __slots__ = ("_side", "_area", "_perimeter", "_size")
+    _FILL = QColor(0x4D, 0xB6, 0xAC)
+    _UNIT_POLY = _polygon(
+        (cos(2 * pi * i / 6), sin(2 * pi * i / 6))
+        for i in range(6)
+    )
+    _ROOT3 = sqrt(3)
+
+    def __init__(self, side):
+        if __debug__:
+            _require_positive("Side must be positive", side)
+        self._side = side
+        self._area = (3 * self._ROOT3 * side * side) / 2
+        self._perimeter = 6 * side
+        # Bounding box: width = 2 * side, height = √3 * side
+        self._size = (2 * side, self._ROOT3 * side, 0)
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        side_px = self._side * scale
+
+        brush, pen = self._style(color)
+
+        polygon = _placed(self._UNIT_POLY, side_px, side_px, cx, cy)
+        item = scene.addPolygon(polygon, pen, brush)
+        item.setZValue(1)
+
+        return [item]
+
+
+class Octagon(Shape2D):
+    __slots__ = ("_side", "_area", "_perimeter", "_size")
+    _FILL = QColor(0x79, 0x86, 0xCB)
+    _UNIT_POLY = _polygon(
+        (cos(2 * pi * i / 8 - pi/8), sin(2 * pi * i / 8 - pi/8))
+        for i in range(8)
+    )
+    _SILVER = 1 + sqrt(2)  # area / (2 * side**2), and the width / side
+    _COS_PI_8 = cos(pi/8)
+
+    def __init__(self, side):
+        if __debug__:
+            _require_positive("Side must be positive", side)
+        self._side = side
+        self._area = 2 * self._SILVER * side * side
+        self._perimeter = 8 * side
+        # Bounding box: width = height = (1 + √2) * side
+        size = self._SILVER * side
+        self._size = (size, size, 0)
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        r_px = self._side / self._COS_PI_8 * scale
+
+        brush, pen = self._style(color)
+
+        polygon = _placed(self._UNIT_POLY, r_px, r_px, cx, cy)
+        item = scene.addPolygon(polygon, pen, brush)
+        item.setZValue(1)
+
+        return [item]
+
+
+class Star(Shape2D):
+    __slots__ = ("_outer_radius", "_inner_radius", "_outline", "_area", "_perimeter", "_size")
+    _FILL = QColor(0xFF, 0xD5, 0x4F)
+    # Unit directions of the 10 vertices, alternating outer/inner, computed once at import
+    _UNIT_VERTS = tuple(
+        (cos(pi/2 + 2 * pi * i / 10), sin(pi/2 + 2 * pi * i / 10))
+        for i in range(10)
+    )
+    # sin(pi/5) * sin(3pi/10) / sin(7pi/10), the angular factor of the area approximation
+    _AREA_FACTOR = sin(pi/5) * sin(3*pi/10) / sin(7*pi/10)
+
+    def __init__(self, outer_radius, inner_radius):
+        if __debug__:
+            _require_positive("Radii must be positive", outer_radius, inner_radius)
+        self._outer_radius = outer_radius
+        self._inner_radius = inner_radius
+        # Vertex offsets from the center in shape units; draw only scales and shifts them
+        radii = (outer_radius, inner_radius) * 5
+        self._outline = _polygon([(r * ux, r * uy) for r, (ux, uy) in zip(radii, self._UNIT_VERTS)])
+        # Approximation for a 5-pointed star
+        self._area = 5 * outer_radius * inner_radius * self._AREA_FACTOR
+        # Approximation: 10 * average of radii
+        self._perimeter = 10 * (outer_radius + inner_radius) / 2
+        self._size = (2 * outer_radius, 2 * outer_radius, 0)
+
+    def area(self):
+        return self._area
+
+    def perimeter(self):
+        return self._perimeter
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        brush, pen = self._style(color)
+
+        polygon = _placed(self._outline, scale, scale, cx, cy)
+        item = scene.addPolygon(polygon, pen, brush)
+        item.setZValue(1)
+
+        return [item]
+
+
+# ----------------- 3D Shapes -----------------
+class Sphere(Shape3D):
+    __slots__ = ("_radius", "_area", "_volume", "_size")
+    _FILL = QColor(0x64, 0xB5, 0xF6)
+
+    # Highlight (offset, size) as fractions of the diameter
+    _HIGHLIGHT = (0.2, 0.6)
+
+    def __init__(self, radius):
+        if __debug__:
+            _require_positive("Radius must be positive", radius)
+        self._radius = radius
+        self._area = 4 * pi * radius * radius
+        self._volume = (4/3) * pi * radius * radius * radius
+        d = 2 * radius
+        self._size = (d, d, d)
+
+    def area(self):
+        return self._area
+
+    def volume(self):
+        return self._volume
+
+    def natural_size(self):
+        return self._size
+
+    def bounding_box(self, cx, cy, scale):
+        r = self._radius * scale
+        return (cx - r, cy - r, cx + r, cy + r)
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        # Represent 3D sphere as a circle with shading
+        diameter_px = 2 * self._radius * scale
+
+        brush, pen = self._style(color)
+        highlight_brush = self._shade(color, lighter=150)
+
+        # Draw main circle
+        x = cx - diameter_px/2
+        y = cy - diameter_px/2
+        ellipse = scene.addEllipse(x, y, diameter_px, diameter_px, pen, brush)
+        ellipse.setZValue(1)
+
+        # Draw highlight to give 3D effect
+        offset, size = self._HIGHLIGHT
+        highlight_diameter = diameter_px * size
+        highlight_x = x + diameter_px * offset
+        highlight_y = y + diameter_px * offset
+        highlight = scene.addEllipse(highlight_x, highlight_y,
+                                     highlight_diameter, highlight_diameter,
+                                     _NO_PEN, highlight_brush)
+        highlight.setZValue(2)
+
+        return [ellipse, highlight]
+
+
+class Cube(Shape3D):
+    __slots__ = ("_side", "_area", "_volume", "_size")
+    _FILL = QColor(0xE5, 0x73, 0x73)
+
+    # Perspective faces as offsets from the front face's top-left corner, in side units
+    _TOP_UNIT = _polygon(((0, 0), (1, 0), (0.8, -0.2), (-0.2, -0.2)))
+    _SIDE_UNIT = _polygon(((1, 0), (1, 1), (0.8, 0.8), (0.8, -0.2)))
+
+    def __init__(self, side):
+        if __debug__:
+            _require_positive("Side must be positive", side)
+        self._side = side
+        self._area = 6 * side * side
+        self._volume = side * side * side
+        self._size = (side, side, side)
+
+    def area(self):
+        return self._area
+
+    def volume(self):
+        return self._volume
+
+    def natural_size(self):
+        return self._size
+
+    def bounding_box(self, cx, cy, scale):
+        h = self._side * scale / 2
+        return (cx - h, cy - h, cx + h, cy + h)
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        side_px = self._side * scale
+
+        brush, pen = self._style(color)
+        side_brush = self._shade(color, darker=120)
+        top_brush = self._shade(color, lighter=120)
+
+        x = cx - side_px/2
+        y = cy - side_px/2
+
+        # Draw front face
+        front = scene.addRect(x, y, side_px, side_px, pen, brush)
+        front.setZValue(1)
+
+        # Draw top face (perspective)
+        top = scene.addPolygon(_placed(self._TOP_UNIT, side_px, side_px, x, y), pen, top_brush)
+        top.setZValue(0)
+
+        # Draw side face (perspective)
+        side = scene.addPolygon(_placed(self._SIDE_UNIT, side_px, side_px, x, y), pen, side_brush)
+        side.setZValue(0)
+
+        return [front, top, side]
+
+
+class Cylinder(Shape3D):
+    __slots__ = ("_radius", "_height", "_area", "_volume", "_size")
+    _FILL = QColor(0xAE, 0xD5, 0x81)
+
+    def __init__(self, radius, height):
+        if __debug__:
+            _require_positive("Radius and height must be positive", radius, height)
+        self._radius = radius
+        self._height = height
+        self._area = 2 * pi * radius * (radius + height)
+        self._volume = pi * radius * radius * height
+        self._size = (2 * radius, height, 2 * radius)
+
+    def area(self):
+        return self._area
+
+    def volume(self):
+        return self._volume
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        radius_px = self._radius * scale
+        height_px = self._height * scale
+
+        brush, pen = self._style(color)
+        top_brush = self._shade(color, lighter=120)
+        bottom_brush = self._shade(color, darker=120)
+
+        # Draw main body (rectangle)
+        x = cx - radius_px
+        y = cy - height_px/2
+        body = scene.addRect(x, y, 2 * radius_px, height_px, pen, brush)
+        body.setZValue(1)
+
+        # Draw top ellipse
+        top_ellipse = scene.addEllipse(x, y - radius_px/2, 2 * radius_px, radius_px,
+                                       pen, top_brush)
+        top_ellipse.setZValue(2)
+
+        # Draw bottom ellipse
+        bottom_ellipse = scene.addEllipse(x, y + height_px - radius_px/2, 2 * radius_px, radius_px,
+                                          pen, bottom_brush)
+        bottom_ellipse.setZValue(0)
+
+        return [body, top_ellipse, bottom_ellipse]
+
+
+class Cone(Shape3D):
+    __slots__ = ("_radius", "_height", "_area", "_volume", "_size")
+    _FILL = QColor(0xFF, 0xB7, 0x4D)
+    # Apex, base left and base right of the body, in (radius, height) units
+    _BODY_UNIT = _polygon(((0, -0.5), (-1, 0.5), (1, 0.5)))
+
+    def __init__(self, radius, height):
+        if __debug__:
+            _require_positive("Radius and height must be positive", radius, height)
+        self._radius = radius
+        self._height = height
+        slant_height = hypot(radius, height)
+        self._area = pi * radius * (radius + slant_height)
+        self._volume = (pi * radius * radius * height) / 3
+        self._size = (2 * radius, height, 2 * radius)
+
+    def area(self):
+        return self._area
+
+    def volume(self):
+        return self._volume
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        radius_px = self._radius * scale
+        height_px = self._height * scale
+
+        brush, pen = self._style(color)
+        base_brush = self._shade(color, darker=120)
+
+        # Draw base ellipse
+        x = cx - radius_px
+        y = cy + height_px/2 - radius_px/2
+        base = scene.addEllipse(x, y, 2 * radius_px, radius_px, pen, base_brush)
+        base.setZValue(0)
+
+        # Draw cone body (triangle)
+        cone = scene.addPolygon(_placed(self._BODY_UNIT, radius_px, height_px, cx, cy), pen, brush)
+        cone.setZValue(1)
+
+        return [base, cone]
+
+
+class Pyramid(Shape3D):
+    __slots__ = ("_base", "_height", "_front", "_side", "_area", "_volume", "_size")
+    _FILL = QColor(0x95, 0x75, 0xCD)
+
+    def __init__(self, base, height):
+        if __debug__:
+            _require_positive("Base and height must be positive", base, height)
+        self._base = base
+        self._height = height
+        # Face corners as offsets from the center in shape units; draw only scales and shifts them
+        half_b = base / 2
+        half_h = height / 2
+        self._front = _polygon(((0, -half_h), (-half_b, half_h), (half_b, half_h)))
+        self._side = _polygon(((0, -half_h), (half_b, half_h), (half_b, half_h - half_b)))
+        slant_height = hypot(base/2, height)
+        self._area = base * (base + 2 * slant_height)
+        self._volume = (base * base * height) / 3
+        self._size = (base, height, base)
+
+    def area(self):
+        return self._area
+
+    def volume(self):
+        return self._volume
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale, color=None):
+        base_px = self._base * scale
+        height_px = self._height * scale
+
+        brush, pen = self._style(color)
+        shaded_brush = self._shade(color, darker=120)  # base and side faces
+
+        # Draw base (square)
+        x = cx - base_px/2
+        y = cy + height_px/2 - base_px/2
+        base = scene.addRect(x, y, base_px, base_px, pen, shaded_brush)
+        base.setZValue(0)
+
+        # Draw front face (triangle)
+        front = scene.addPolygon(_placed(self._front, scale, scale, cx, cy), pen, brush)
+        front.setZValue(1)
+
+        # Draw side face (triangle with perspective)
+        side = scene.addPolygon(_placed(self._side, scale, scale, cx, cy), pen, shaded_brush)
+        side.setZValue(0.5)
+
+        return [base, front, side]
+
+
+# ----------------- Astronomical Object -----------------
+# Orbit placement angle used for a single static shape (45 degrees below the right)
+_ORBIT_START = radians(45)
+
+
+def _random_position(cx, cy, r, w, h, margin):
+    # The object sits at the scene center, so the scene spans 2*cx by 2*cy pixels
+    x = random.uniform(w/2 + margin, 2*cx - w/2 - margin)
+    y = random.uniform(h/2 + margin, 2*cy - h/2 - margin)
+    return (x, y)
+
+
+# Shape center for each alignment except ORBIT (see orbit_slots), given the object's center (cx, cy), its radius r,
+# the shape's pixel size (w, h) and a pixel margin
+_ALIGN_FNS = {
+    AlignmentType.CENTER: lambda cx, cy, r, w, h, margin: (cx, cy),
+    AlignmentType.TOP: lambda cx, cy, r, w, h, margin: (cx, cy - r - h/2 - margin),
+    AlignmentType.BOTTOM: lambda cx, cy, r, w, h, margin: (cx, cy + r + h/2 + margin),
+    AlignmentType.LEFT: lambda cx, cy, r, w, h, margin: (cx - r - w/2 - margin, cy),
+    AlignmentType.RIGHT: lambda cx, cy, r, w, h, margin: (cx + r + w/2 + margin, cy),
+    AlignmentType.OVERLAP: lambda cx, cy, r, w, h, margin: (cx + 0.15 * r, cy + 0.10 * r),
+    AlignmentType.RANDOM: _random_position,
+}
+
+
+class AstronomicalObject:
+    """Represents astronomical objects for alignment demonstration."""
+
+    __slots__ = ("_radius", "_color", "_label_color", "_name", "_has_rings", "_size")
+    _DEFAULT_COLOR = QColor(0x88, 0x88, 0x88)
+    _OUTLINE_PEN = QPen(QColor(Qt.black), 2)
+    _RING_PEN = QPen(QColor(139, 69, 19), 1)  # Brown border
+    _RING_BRUSH = QBrush(QColor(210, 180, 140, 180))  # Tan color with transparency
+    _DARK_LABEL = QColor(Qt.black)
+    _LIGHT_LABEL = QColor(Qt.white)
+
+    def __init__(self, radius, color=None, name="Planet", has_rings=False):
+        if __debug__:
+            _require_positive("Astronomical radius must be positive", radius)
+        self._radius = radius
+        # Accepts a QColor or a color name; None means the default gray
+        self._color = QColor(color) if color is not None else self._DEFAULT_COLOR
+        # Label color from the object's brightness (white for dark bodies, to stay readable)
+        col = self._color
+        brightness = (col.red() * 0.299 + col.green() * 0.587 + col.blue() * 0.114) / 255
+        self._label_color = self._DARK_LABEL if brightness > 0.6 else self._LIGHT_LABEL
+        self._name = name
+        self._has_rings = has_rings
+        d = 2 * radius
+        self._size = (d, d, d)
+
+    def natural_size(self):
+        return self._size
+
+    def draw(self, scene, cx, cy, scale):
+        diameter_px = 2 * self._radius * scale
+        x = cx - diameter_px/2
+        y = cy - diameter_px/2
+
+        # Draw the astronomical object
+        item = scene.addEllipse(x, y, diameter_px, diameter_px,
+                                self._OUTLINE_PEN, _solid_brush(self._color.rgba()))
+        item.setZValue(0)  # behind shapes
+        items = [item]
+
+        # Draw rings if applicable
+        if self._has_rings:
+            ring_width = diameter_px * 0.2
+            ring_height = diameter_px * 0.05
+            ring_x = cx - (diameter_px + ring_width)/2
+            ring_y = cy - ring_height/2
+            ring = scene.addEllipse(ring_x, ring_y, diameter_px + ring_width, ring_height,
+                                    self._RING_PEN, self._RING_BRUSH)
+            ring.setZValue(0.5)
+            ring.setRotation(30)  # Tilt the rings
+            items.append(ring)
+
+        # Add a label
+        text = scene.addText(self._name)
+        text.setDefaultTextColor(self._label_color)
+        text.setPos(cx - text.boundingRect().width()/2,
+                    cy - text.boundingRect().height()/2)
+        text.setZValue(1)
+        items.append(text)
+
+        return items
+
+    def orbit_radius(self, shape, scale, margin=10):
+        """Pixel radius of an orbit that keeps shape clear of this object's surface."""
+        return self._radius * scale + shape.natural_size()[0] * scale / 2 + margin
+
+    def orbit_slots(self, cx, cy, orbit_radii_px):
+        """Return one (x, y) orbit slot around (cx, cy) per radius in orbit_radii_px.
+
+        The slots are evenly spaced, starting from the single-shape orbit slot at 45 degrees.
+        """
+        if not orbit_radii_px:
+            return []
+        ring = _unit_ring(len(orbit_radii_px), _ORBIT_START)
+        return [(cx + r * c, cy + r * s) for r, (c, s) in zip(orbit_radii_px, ring)]
+
+    def bounding_box(self, cx, cy, scale):
+        d = 2 * self._radius
+        return _centered_box(d, d, cx, cy, scale)
+
+    def calculate_alignment_position(self, shape, alignment, scene_rect, scale):
+        """Calculate position for shape based on alignment with this astronomical object."""
+        return self.calculate_alignment_positions((shape,), alignment, scene_rect, scale)[0]
+
+    def calculate_alignment_positions(self, shapes, alignment, scene_rect, scale):
+        """Positions for several shapes sharing one alignment, in the order given.
+
+        Scene and object geometry are worked out once for the whole batch. ORBIT spreads
+        the shapes evenly around the object rather than stacking them in one slot; a lone
+        shape gets the 45-degree slot.
+        """
+        if not shapes:
+            return []
+        astro_cx = scene_rect.width() / 2
+        astro_cy = scene_rect.height() / 2
+        astro_radius_px = self._radius * scale
+        margin = 10  # Pixel margin
+
+        if alignment == AlignmentType.ORBIT:
+            radii = [self.orbit_radius(shape, scale, margin) for shape in shapes]
+            return self.orbit_slots(astro_cx, astro_cy, radii)
+
+        sizes = [shape.natural_size() for shape in shapes]
+        place = _ALIGN_FNS.get(alignment, _ALIGN_FNS[AlignmentType.CENTER])
+        return [place(astro_cx, astro_cy, astro_radius_px, w * scale, h * scale, margin)
+                for w, h, _ in sizes]
+
+
+# ----------------- Shape Factory -----------------
+class ShapeFactory:
+    """Factory class to create shape instances based on type and parameters."""
+
+    _CONSTRUCTORS = {
+        ShapeType.CIRCLE: Circle,
+        ShapeType.RECTANGLE: Rectangle,
+        ShapeType.TRIANGLE: Triangle,
+        ShapeType.SQUARE: Square,
+        ShapeType.ELLIPSE: Ellipse,
+        ShapeType.PARALLELOGRAM: Parallelogram,
+        ShapeType.RHOMBUS: Rhombus,
+        ShapeType.PENTAGON: Pentagon,
+        ShapeType.HEXAGON: Hexagon,
+        ShapeType.OCTAGON: Octagon,
+        ShapeType.STAR: Star,
+        ShapeType.SPHERE: Sphere,
+        ShapeType.CUBE: Cube,
+        ShapeType.CYLINDER: Cylinder,
+        ShapeType.CONE: Cone,
+        ShapeType.PYRAMID: Pyramid,
+    }
+
+    @staticmethod
+    def create_shape(shape_type, params):
+        constructor = ShapeFactory._CONSTRUCTORS.get(shape_type)
+        if constructor is None:
+            raise ValueError(f"Unknown shape type: {shape_type}")
+        return constructor(*params)